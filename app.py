@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import copy
+import functools
+import mimetypes
 import os
 import re
 import ssl
@@ -8,16 +10,34 @@ import subprocess
 import threading
 import uuid
 import signal
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 
-from flask import Flask, abort, flash, jsonify, redirect, render_template, request, url_for
-from flask import send_from_directory
+from flask import Flask, abort, flash, g, jsonify, redirect, render_template, request, url_for
+from flask import Response, send_file
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
 from werkzeug.utils import secure_filename
 
-from transcriber import WhisperOptions, transcribe_file
+from flask.json.provider import DefaultJSONProvider
+
+try:  # optional: faster JSON encoding for API responses
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:  # optional: serve capture images without entering Flask
+    from whitenoise import WhiteNoise
+except ImportError:  # pragma: no cover - optional dependency
+    WhiteNoise = None
+
+from transcriber import WhisperOptions, start_model_warmup, transcribe_file
 from summarizer import (
     DEFAULT_SUMMARY_MODEL,
     SummaryResult,
@@ -25,20 +45,28 @@ from summarizer import (
     summarize_transcript,
 )
 from youtube_recorder_bot import (
+    DEFAULT_CONFIG_PATH,
+    USER_CONFIG_PATH,
     capture_live_frame,
     ffmpeg_path,
     fetch_video_title,
     list_gdrive_folders,
     load_settings,
-    resolve_live_stream_url,
+    resolve_live_stream,
     save_settings,
+    upload_many_to_gdrive,
+    upload_stream_to_gdrive,
+    upload_status,
     upload_to_gdrive,
+    upload_to_gdrive_async,
     yt_download,
+    yt_pipe_to_gdrive,
 )
 
 
 BASE_DIR = Path(__file__).resolve().parent
 DEFAULT_MANUAL_REMOTE_PATH = "parchment"
+CAPTURE_ACCEL_PREFIX = "/_protected_captures/"
 
 
 def _load_env_file(env_path: Path = BASE_DIR / ".env") -> None:
@@ -57,11 +85,43 @@ def _load_env_file(env_path: Path = BASE_DIR / ".env") -> None:
 
 _load_env_file()
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson while keeping Flask's fallbacks."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 app.secret_key = "dev-secret"  # replace in production
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_port=1)
 
 
+def _mount_whitenoise() -> None:
+    """Serve /captures/ through WhiteNoise when USE_WHITENOISE is enabled.
+
+    Outside debug mode WhiteNoise indexes the files present at start-up and
+    does no per-request scan; captures written later fall through to the
+    Flask ``serve_capture`` route.
+    """
+
+    if WhiteNoise is None or not _bool_env("USE_WHITENOISE"):
+        return
+
+    capture_dir = Path(load_settings().get("paths", {}).get("captures") or BASE_DIR / "static" / "captures")
+    capture_dir = capture_dir.expanduser()
+    capture_dir.mkdir(parents=True, exist_ok=True)
+    app.wsgi_app = WhiteNoise(app.wsgi_app, root=str(capture_dir), prefix="captures/", autorefresh=app.debug, max_age=3600)
+
+
 @dataclass
 class TaskStatus:
     id: str
@@ -81,16 +141,36 @@ class TaskStatus:
         return data
 
 
+TASK_TTL = timedelta(hours=6)
+_FINISHED_STATES = frozenset({"completed", "failed"})
+
+
 class TaskRegistry:
-    def __init__(self) -> None:
-        self._tasks: dict[str, TaskStatus] = {}
+    def __init__(self, ttl: timedelta = TASK_TTL) -> None:
+        # Insertion order is creation order, so expiry can stop at the first
+        # task younger than the TTL.
+        self._tasks: OrderedDict[str, TaskStatus] = OrderedDict()
+        self._ttl = ttl
         self._lock = threading.Lock()
 
+    def _expire(self, now: datetime) -> None:
+        expired = []
+        for task_id, task in self._tasks.items():
+            if now - task.created_at < self._ttl:
+                break
+            # A stuck or long-running task is kept but must not shield the
+            # finished ones queued behind it.
+            if task.status in _FINISHED_STATES:
+                expired.append(task_id)
+        for task_id in expired:
+            del self._tasks[task_id]
+
     def create(self, kind: str, label: str, *, message: str = "대기 중") -> TaskStatus:
         task = TaskStatus(id=uuid.uuid4().hex, kind=kind, label=label, message=message)
         with self._lock:
+            self._expire(task.created_at)
             self._tasks[task.id] = task
-        return copy.deepcopy(task)
+        return replace(task)
 
     def update(
         self,
@@ -115,16 +195,51 @@ class TaskRegistry:
             if detail is not None:
                 task.detail = detail
             task.updated_at = datetime.utcnow()
-            return copy.deepcopy(task)
+            return replace(task)
 
     def get(self, task_id: str) -> TaskStatus | None:
         with self._lock:
             task = self._tasks.get(task_id)
-            return copy.deepcopy(task) if task else None
+            # Every field is immutable, so a shallow copy is a safe snapshot.
+            return replace(task) if task else None
 
 
 tasks = TaskRegistry()
 
+# Long-running download/transcript/summary jobs run here so request handlers
+# return immediately with a task id that the UI polls via /tasks/<id>.
+BACKGROUND_WORKERS = 4
+_background = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="ytweb-task")
+# Caps concurrent Whisper jobs at the model's worker count so parallel tasks
+# queue for the model instead of exhausting GPU memory.
+_WHISPER_WORKERS = max(WhisperOptions().num_workers, 1)
+_whisper_slots = threading.BoundedSemaphore(_WHISPER_WORKERS)
+# Long inputs may hold all but one slot, so a short clip never queues behind
+# a batch of hour-long recordings. File size stands in for duration so
+# queueing a job does not spawn ffprobe.
+SHORT_TRANSCRIBE_BYTES = 32 * 1024 * 1024
+_whisper_long_slots = threading.BoundedSemaphore(max(_WHISPER_WORKERS - 1, 1))
+# Transcriptions wait for a slot on their own threads, so queued Whisper jobs
+# never hold the workers that downloads and summaries run on.
+_transcribe_background = ThreadPoolExecutor(
+    max_workers=BACKGROUND_WORKERS, thread_name_prefix="ytweb-whisper"
+)
+
+
+@contextmanager
+def _whisper_slot(media: Path):
+    try:
+        size = media.stat().st_size
+    except OSError:
+        size = None
+    if size is not None and size < SHORT_TRANSCRIBE_BYTES:
+        with _whisper_slots:
+            yield
+        return
+
+    with _whisper_long_slots, _whisper_slots:
+        yield
+
 
 class LiveRecorder:
     def __init__(self) -> None:
@@ -218,7 +333,12 @@ class LiveRecorder:
         self.paused = False
         self._cancel_pause_timer()
 
-        if output_path and output_path.exists() and output_path.stat().st_size > 0:
+        try:
+            recorded = output_path is not None and output_path.stat().st_size > 0
+        except OSError:
+            recorded = False
+
+        if recorded:
             if reason:
                 return True, f"{reason} (파일: {output_path.name})"
             return True, f"녹화가 완료되었습니다: {output_path.name}"
@@ -264,6 +384,9 @@ _live_recorder = LiveRecorder()
 _live_recorder_lock = threading.Lock()
 
 
+# The environment is settled once .env is loaded at import and nothing in
+# the app mutates it, so flag and path lookups made per request are cached.
+@functools.lru_cache(maxsize=None)
 def _bool_env(key: str, default: bool = False) -> bool:
     value = os.getenv(key)
     if value is None:
@@ -271,18 +394,135 @@ def _bool_env(key: str, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
-def _jobs_state():
+_mount_whitenoise()
+
+DEBUG_MODE = _bool_env("FLASK_DEBUG")
+_JINJA_CACHE_DIR = Path(os.getenv("JINJA_CACHE_DIR") or BASE_DIR / ".jinja_cache").expanduser()
+try:
+    _JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+except OSError:
+    app.logger.warning("Jinja bytecode cache disabled: cannot create %s", _JINJA_CACHE_DIR)
+else:
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=str(_JINJA_CACHE_DIR))
+if not DEBUG_MODE:
+    app.config["TEMPLATES_AUTO_RELOAD"] = False
+    app.jinja_env.auto_reload = False
+
+
+_SETTINGS_CACHE: dict = {"mtime": None, "data": None, "resolved": None}
+_settings_cache_lock = threading.Lock()
+
+
+def _settings_mtime() -> tuple[int | None, ...]:
+    stamps: list[int | None] = []
+    for path in (DEFAULT_CONFIG_PATH, USER_CONFIG_PATH):
+        try:
+            stamps.append(path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+def _cached_load_settings() -> dict:
+    """Return the shared settings dict, re-parsing only when a config file changed.
+
+    Callers must treat the result as read-only; copy it before mutating.
+    """
+
+    mtime = _settings_mtime()
+    if _SETTINGS_CACHE["data"] is not None and _SETTINGS_CACHE["mtime"] == mtime:
+        return _SETTINGS_CACHE["data"]
+
+    with _settings_cache_lock:
+        # Another thread may have reloaded while we waited for the lock.
+        if _SETTINGS_CACHE["data"] is not None and _SETTINGS_CACHE["mtime"] == mtime:
+            return _SETTINGS_CACHE["data"]
+
+        data = load_settings()
+        _SETTINGS_CACHE.update(mtime=mtime, data=data, resolved=_resolve_settings_paths(data))
+        return data
+
+
+def _resolve_settings_paths(settings: dict) -> dict[str, Path]:
+    captures = settings.get("paths", {}).get("captures") or BASE_DIR / "static" / "captures"
     return {
-        "recording": {"live": 32, "download": 0},
-        "transcript": {"active": 0},
-        "summary": {"active": 0},
+        "downloads_root": _downloads_root(settings).resolve(),
+        "captures": Path(captures).expanduser().resolve(),
+    }
+
+
+def _resolved_paths() -> dict[str, Path]:
+    """Return the expanded and resolved directories for the current settings.
+
+    They are computed once per settings reload instead of calling
+    ``realpath`` on every request.
+    """
+
+    _settings()
+    return _SETTINGS_CACHE["resolved"]
+
+
+def _settings() -> dict:
+    """Return settings loaded once per request and cached on ``flask.g``."""
+
+    settings = getattr(g, "_settings", None)
+    if settings is None:
+        settings = _cached_load_settings()
+        g._settings = settings
+    return settings
+
+
+@app.before_request
+def _reset_settings_cache() -> None:
+    g._settings = None
+
+
+# Static placeholder counters for the dashboard; read-only so it can be shared.
+_JOBS_STATE = MappingProxyType(
+    {
+        "recording": MappingProxyType({"live": 32, "download": 0}),
+        "transcript": MappingProxyType({"active": 0}),
+        "summary": MappingProxyType({"active": 0}),
     }
+)
+
+
+_LIST_CACHE: dict[tuple[str, bool], tuple[int, list[str]]] = {}
+
+
+def _scan_names(path: Path, *, dirs: bool = False) -> list[str] | None:
+    """Return sorted file (or sub-directory) names of ``path``, None if missing.
+
+    Listings are cached per directory and reused until the directory's
+    ``st_mtime_ns`` changes, which happens on every create/delete/rename.
+    The returned list is shared; do not mutate it.
+    """
+
+    try:
+        mtime = path.stat().st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    key = (str(path), dirs)
+    hit = _LIST_CACHE.get(key)
+    if hit and hit[0] == mtime:
+        return hit[1]
+
+    try:
+        with os.scandir(path) as entries:
+            if dirs:
+                names = sorted(entry.name for entry in entries if entry.is_dir(follow_symlinks=False))
+            else:
+                names = sorted(entry.name for entry in entries if entry.is_file(follow_symlinks=False))
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    _LIST_CACHE[key] = (mtime, names)
+    return names
 
 
 def _list_files(path: Path) -> list[str]:
-    if not path.exists():
-        return []
-    return sorted(item.name for item in path.iterdir() if item.is_file())
+    return _scan_names(path) or []
 
 
 def _downloads_root(settings: dict) -> Path:
@@ -306,9 +546,15 @@ def _summary_sources(settings: dict) -> list[dict]:
     return [{"name": "전사 파일", "files": _list_files(transcripts_dir)}]
 
 
+_TITLE_FORBIDDEN = frozenset('\\/:*?"<>|')
+_TITLE_FORBIDDEN_RE = re.compile(r"[\\/:*?\"<>|]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _sanitize_title(value: str) -> str:
-    cleaned = re.sub(r"[\\/:*?\"<>|]", "", value).strip()
-    cleaned = re.sub(r"\s+", " ", cleaned)
+    # Most titles are already clean, so skip the first regex pass for them.
+    cleaned = _TITLE_FORBIDDEN_RE.sub("", value) if not _TITLE_FORBIDDEN.isdisjoint(value) else value
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned.strip())
     return cleaned or "live"
 
 
@@ -329,7 +575,7 @@ def _live_output_path(settings: dict, title: str | None = None) -> Path:
 def _resolve_existing_file(file_name: str, *directories: Path) -> Path | None:
     for directory in directories:
         candidate = (directory / file_name).expanduser().resolve()
-        if candidate.exists() and candidate.is_file():
+        if candidate.is_file():
             return candidate
     return None
 
@@ -338,13 +584,30 @@ def _unique_output_path(directory: Path, base_name: str, suffix: str) -> Path:
     directory.mkdir(parents=True, exist_ok=True)
     safe_stem = _sanitize_title(base_name or "output").replace(" ", "_")
     candidate = directory / f"{safe_stem}{suffix}"
-    counter = 1
-    while candidate.exists():
-        candidate = directory / f"{safe_stem}_{counter}{suffix}"
-        counter += 1
+    if candidate.exists():
+        # A random suffix avoids probing _1, _2, ... one stat() at a time.
+        candidate = directory / f"{safe_stem}_{uuid.uuid4().hex[:8]}{suffix}"
     return candidate
 
 
+def _file_action_response(file_name: str, message: str, ok: bool, status: int, extra: dict | None = None):
+    """Shared JSON-or-redirect response for the transcript/summary actions."""
+
+    payload = {"ok": ok, "message": message, "file_name": file_name}
+    if extra:
+        payload.update(extra)
+
+    if request.is_json or request.accept_mimetypes["application/json"] >= request.accept_mimetypes["text/html"]:
+        return jsonify(payload), status
+    flash(message, "success" if ok else "warning")
+    return redirect(url_for("index"))
+
+
+@functools.lru_cache(maxsize=1)
+def _cert_paths() -> tuple[Path, Path]:
+    return Path(os.getenv("SSL_CERT_FILE", "")), Path(os.getenv("SSL_KEY_FILE", ""))
+
+
 def _ssl_context():
     """Return an SSL context tuple when certificate paths are configured.
 
@@ -353,9 +616,7 @@ def _ssl_context():
     SSL_CERT_FILE and SSL_KEY_FILE environment variables.
     """
 
-    cert_path = Path(os.getenv("SSL_CERT_FILE", ""))
-    key_path = Path(os.getenv("SSL_KEY_FILE", ""))
-
+    cert_path, key_path = _cert_paths()
     if cert_path.exists() and key_path.exists():
         return str(cert_path), str(key_path)
     return None
@@ -367,56 +628,85 @@ def _reverse_proxy_enabled() -> bool:
     return _bool_env("USE_REVERSE_PROXY_SSL")
 
 
+def _accel_redirect_enabled() -> bool:
+    """Return True when NGINX should serve capture files via X-Accel-Redirect."""
+
+    return _reverse_proxy_enabled() and _bool_env("USE_X_ACCEL_REDIRECT")
+
+
+_CERT_CACHE: dict = {"path": None, "mtime": None, "subject": None}
+
+
+def _stat_mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _cert_subject(cert_path: Path, mtime: int) -> str | None:
+    """Return the certificate CN, decoding again only when the file changes."""
+
+    if _CERT_CACHE["path"] == str(cert_path) and _CERT_CACHE["mtime"] == mtime:
+        return _CERT_CACHE["subject"]
+
+    subject = None
+    try:
+        cert_info = ssl._ssl._test_decode_cert(str(cert_path))
+        subject_items = dict(cert_info.get("subject", []))
+        cn = subject_items.get("commonName") or subject_items.get("organizationName")
+        if cn:
+            subject = cn
+    except Exception:
+        subject = None
+
+    _CERT_CACHE.update(path=str(cert_path), mtime=mtime, subject=subject)
+    return subject
+
+
+@functools.lru_cache(maxsize=1)
+def _external_host() -> str | None:
+    return os.getenv("EXTERNAL_HOST") or os.getenv("SERVER_NAME")
+
+
 def _https_status() -> dict:
     """Return certificate visibility hints for the UI."""
 
     if _reverse_proxy_enabled():
-        domain = (
-            os.getenv("EXTERNAL_HOST")
-            or os.getenv("SERVER_NAME")
-            or "설정한 도메인"
-        )
+        domain = _external_host() or "설정한 도메인"
         return {
             "active": True,
             "message": "NGINX 리버스 프록시가 Let's Encrypt 인증서를 관리하며 Flask는 HTTP로 동작합니다.",
             "cert_subject": domain,
         }
 
-    cert_path = Path(os.getenv("SSL_CERT_FILE", ""))
-    key_path = Path(os.getenv("SSL_KEY_FILE", ""))
-    if not (cert_path.exists() and key_path.exists()):
+    cert_path, key_path = _cert_paths()
+    cert_mtime = _stat_mtime(cert_path)
+    if cert_mtime is None or _stat_mtime(key_path) is None:
         return {
             "active": False,
             "message": "유효한 인증서 경로가 설정되지 않아 HTTP로 동작 중입니다. 리버스 프록시를 사용한다면 USE_REVERSE_PROXY_SSL 환경 변수를 true로 지정하세요.",
             "cert_subject": None,
         }
 
-    subject = None
-    try:
-        cert_info = ssl._ssl._test_decode_cert(str(cert_path))
-        subject_items = dict(cert_info.get("subject", []))
-        cn = subject_items.get("commonName") or subject_items.get("organizationName")
-        if cn:
-            subject = cn
-    except Exception:
-        subject = None
-
     return {
         "active": True,
         "message": "신뢰할 수 있는 인증서가 필요합니다. 발급 기관이 루트 인증서에 포함되어야 경고가 사라집니다.",
-        "cert_subject": subject,
+        "cert_subject": _cert_subject(cert_path, cert_mtime),
     }
 
 
+_LIVE_URL_PATTERN = re.compile(r"youtube\.com/live|youtu\.be|live\.youtube\.com", re.IGNORECASE)
+
+
 def _looks_like_live_url(url: str) -> bool:
-    lowered = url.lower()
-    return any(marker in lowered for marker in ["youtube.com/live", "youtu.be", "live.youtube.com"])
+    return _LIVE_URL_PATTERN.search(url) is not None
 
 
 @app.route("/")
 def index():
-    settings = load_settings()
-    jobs = _jobs_state()
+    settings = _settings()
+    jobs = _JOBS_STATE
     return render_template(
         "index.html",
         settings=settings,
@@ -429,13 +719,22 @@ def index():
     )
 
 
+# Recorder controls that only differ by the method called and the flash
+# category on success; looked up once instead of an if-chain per action.
+_RECORDER_CONTROLS: dict[str, tuple[str, str]] = {
+    "종료": ("stop", "info"),
+    "일시정지": ("pause", "info"),
+    "재시작": ("resume", "success"),
+}
+
+
 @app.route("/record/live", methods=["POST"])
 def record_live_action():
     is_json = request.is_json
     payload = request.get_json(silent=True) or {}
     action = (payload.get("action") or request.form.get("action") or "").strip()
     live_url = (payload.get("live_url") or request.form.get("live_url") or "").strip()
-    settings = load_settings()
+    settings = _settings()
 
     def respond(message: str, category: str = "info", status: int = 200):
         if is_json:
@@ -450,40 +749,23 @@ def record_live_action():
         if not _looks_like_live_url(live_url):
             return respond("라이브 링크를 넣어주세요. 실시간 스트림 주소를 확인하세요.", "warning", 400)
 
-        stream_url, error = resolve_live_stream_url(live_url)
+        stream_url, live_title, error = resolve_live_stream(live_url)
         if error or not stream_url:
             return respond(error or "스트리밍 URL을 확인하지 못했습니다.", "danger", 400)
 
-        live_title, _ = fetch_video_title(live_url)
         output_path = _live_output_path(settings, live_title)
         with _live_recorder_lock:
             ok, message = _live_recorder.start(stream_url, output_path)
 
         return respond(message, "success" if ok else "danger", 200 if ok else 500)
 
-    if action == "종료":
-        with _live_recorder_lock:
-            ok, message = _live_recorder.stop()
-
-        category = "info" if ok else "warning"
-        status = 200 if ok else 400
-        return respond(message, category, status)
-
-    if action == "일시정지":
-        with _live_recorder_lock:
-            ok, message = _live_recorder.pause()
-
-        category = "info" if ok else "warning"
-        status = 200 if ok else 400
-        return respond(message, category, status)
-
-    if action == "재시작":
+    control = _RECORDER_CONTROLS.get(action)
+    if control is not None:
+        method, category = control
         with _live_recorder_lock:
-            ok, message = _live_recorder.resume()
+            ok, message = getattr(_live_recorder, method)()
 
-        category = "success" if ok else "warning"
-        status = 200 if ok else 400
-        return respond(message, category, status)
+        return respond(message, category if ok else "warning", 200 if ok else 400)
 
     if action:
         return respond(f"{action} 작업을 시작했습니다.", "info")
@@ -495,7 +777,7 @@ def record_live_action():
 def capture_live_action():
     payload = request.get_json(silent=True) or {}
     live_url = (payload.get("live_url") or "").strip()
-    settings = load_settings()
+    settings = _settings()
     capture_dir = Path(settings.get("paths", {}).get("captures") or BASE_DIR / "static" / "captures")
 
     if not live_url:
@@ -514,14 +796,58 @@ def capture_live_action():
 
 @app.route("/captures/<path:filename>")
 def serve_capture(filename: str):
-    settings = load_settings()
-    capture_dir = Path(settings.get("paths", {}).get("captures") or BASE_DIR / "static" / "captures").expanduser().resolve()
+    capture_dir = _resolved_paths()["captures"]
     file_path = (capture_dir / filename).resolve()
 
-    if not str(file_path).startswith(str(capture_dir)) or not file_path.exists():
+    if not file_path.is_relative_to(capture_dir) or not file_path.exists():
         abort(404)
 
-    return send_from_directory(capture_dir, file_path.name)
+    if _accel_redirect_enabled():
+        relative = file_path.relative_to(capture_dir).as_posix()
+        content_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+        return Response(
+            "",
+            headers={"X-Accel-Redirect": CAPTURE_ACCEL_PREFIX + relative, "Content-Type": content_type},
+        )
+
+    # send_file hands the open file to ``wsgi.file_wrapper`` so servers such as
+    # gunicorn can use sendfile(2) instead of a Python read loop.
+    return send_file(file_path, conditional=True, etag=True, max_age=3600)
+
+
+def _run_post_download(
+    media: Path, settings: dict, upload_remote: str, do_transcribe: bool
+) -> list[str]:
+    """Upload and transcribe a finished download side by side.
+
+    The upload is network-bound and Whisper is CPU/GPU-bound, so running them
+    together saves roughly the shorter of the two.
+    """
+
+    notes: list[str] = []
+    transcript_future = None
+    if do_transcribe:
+        transcripts_dir = Path(
+            settings.get("paths", {}).get("transcripts", "/root/rcbot/downloads/transcripts")
+        ).expanduser()
+        output_path = _unique_output_path(transcripts_dir, media.stem, ".txt")
+
+        def _transcribe() -> tuple[Path | None, str | None]:
+            with _whisper_slot(media):
+                return transcribe_file(media, output_path)
+
+        transcript_future = _transcribe_background.submit(_transcribe)
+
+    # The upload runs on this worker while Whisper works on its own pool.
+    if upload_remote:
+        _, message = upload_to_gdrive(
+            media, upload_remote, settings.get("auth", {}), tuning=settings.get("rclone")
+        )
+        notes.append(message)
+    if transcript_future is not None:
+        transcript_path, error = transcript_future.result()
+        notes.append(f"전사 완료: {transcript_path.name}" if transcript_path else error or "전사에 실패했습니다.")
+    return notes
 
 
 @app.route("/download", methods=["POST"])
@@ -532,29 +858,68 @@ def download_action():
     if not link:
         return jsonify({"ok": False, "message": "다운로드할 유튜브 링크를 입력하세요."}), 400
 
-    dest = Path(load_settings().get("paths", {}).get("downloads", "downloads"))
-    result, error = yt_download(link, dest)
-    if error or not result:
-        return (
-            jsonify(
-                {
-                    "ok": False,
-                    "message": error or "다운로드에 실패했습니다. 링크 또는 ffmpeg 설치를 확인하세요.",
-                }
-            ),
-            500,
+    settings = _settings()
+    dest = Path(settings.get("paths", {}).get("downloads", "downloads"))
+    upload_remote = (payload.get("upload_remote") or "").strip()
+    do_transcribe = bool(payload.get("transcribe"))
+    # Upload-only jobs can stream yt-dlp straight into rclone without a local copy.
+    stream_only = bool(upload_remote and payload.get("skip_local") and not do_transcribe)
+    task = tasks.create("download", link, message="다운로드를 준비합니다...")
+
+    def _run_stream_upload(task_id: str) -> None:
+        tasks.update(task_id, status="running", progress=0.05, message="Google Drive로 바로 전송하는 중...")
+        title, _ = fetch_video_title(link)
+        file_stem = _sanitize_title(title or datetime.now().strftime("%Y%m%d_%H%M%S"))
+        ok, message, file_name = yt_pipe_to_gdrive(link, file_stem, upload_remote, settings.get("auth", {}))
+        tasks.update(
+            task_id,
+            status="completed" if ok else "failed",
+            progress=1.0 if ok else 0.0,
+            message=message,
+            detail=file_name if ok else None,
         )
 
-    message = f"다운로드 완료: {result.name}"
-    flash(message, "success")
-    return jsonify({"ok": True, "message": message, "file_name": result.name})
+    def _run_download(task_id: str) -> None:
+        try:
+            if stream_only:
+                _run_stream_upload(task_id)
+                return
+
+            tasks.update(task_id, status="running", progress=0.05, message="다운로드 중...")
+            result, error = yt_download(link, dest)
+            if error or not result:
+                tasks.update(
+                    task_id,
+                    status="failed",
+                    message=error or "다운로드에 실패했습니다. 링크 또는 ffmpeg 설치를 확인하세요.",
+                )
+                return
+
+            notes = [f"다운로드 완료: {result.name}"]
+            if upload_remote or do_transcribe:
+                tasks.update(task_id, status="running", progress=0.6, message="후속 작업을 진행하는 중...")
+                notes.extend(_run_post_download(result, settings, upload_remote, do_transcribe))
+
+            tasks.update(
+                task_id,
+                status="completed",
+                progress=1.0,
+                message=" / ".join(notes),
+                detail=result.name,
+            )
+        except Exception as exc:  # noqa: BLE001 - surfaced to caller for debugging
+            app.logger.exception("Download worker failed for %s", link)
+            tasks.update(task_id, status="failed", message=f"다운로드 중 서버 오류가 발생했습니다: {exc}")
+
+    _background.submit(_run_download, task.id)
+    return jsonify({"ok": True, "message": "다운로드를 시작했습니다.", "task_id": task.id}), 202
 
 
 @app.route("/transcript", methods=["POST"])
 def transcript_action():
     payload = request.get_json(silent=True) or {}
     file_name = (payload.get("file_name") or request.form.get("file_name") or "").strip()
-    settings = load_settings()
+    settings = _settings()
     paths = settings.get("paths", {})
 
     downloads_dir = Path(paths.get("downloads", "/root/rcbot/downloads/link")).expanduser()
@@ -562,14 +927,7 @@ def transcript_action():
     transcripts_dir = Path(paths.get("transcripts", "/root/rcbot/downloads/transcripts")).expanduser()
 
     def respond(message: str, ok: bool, status: int, extra: dict | None = None):
-        payload = {"ok": ok, "message": message, "file_name": file_name}
-        if extra:
-            payload.update(extra)
-
-        if request.is_json or request.accept_mimetypes["application/json"] >= request.accept_mimetypes["text/html"]:
-            return jsonify(payload), status
-        flash(message, "success" if ok else "warning")
-        return redirect(url_for("index"))
+        return _file_action_response(file_name, message, ok, status, extra)
 
     try:
         if not file_name:
@@ -590,9 +948,10 @@ def transcript_action():
                 def _progress_callback(progress: float, message: str) -> None:
                     tasks.update(task_id, status="running", progress=progress, message=message)
 
-                transcript_path, error = transcribe_file(
-                    source, output_path, options=options, on_progress=_progress_callback
-                )
+                with _whisper_slot(source):
+                    transcript_path, error = transcribe_file(
+                        source, output_path, options=options, on_progress=_progress_callback
+                    )
                 if error or not transcript_path:
                     tasks.update(task_id, status="failed", message=error or "전사 작업에 실패했습니다.")
                     return
@@ -612,7 +971,7 @@ def transcript_action():
                     message=f"전사 처리 중 서버 오류가 발생했습니다: {exc}",
                 )
 
-        threading.Thread(target=_run_transcription, args=(task.id,), daemon=True).start()
+        _transcribe_background.submit(_run_transcription, task.id)
         return respond("전사 작업을 시작했습니다. 진행률을 확인하세요.", True, 202, {"task_id": task.id})
     except Exception as exc:  # noqa: BLE001 - surfaced to caller for debugging
         app.logger.exception("Transcript request failed for %s", file_name or "<missing>")
@@ -626,7 +985,7 @@ def summary_action():
     payload = request.get_json(silent=True) or {}
     file_name = (payload.get("file_name") or request.form.get("file_name") or "").strip()
     requested_model = (payload.get("model") or request.form.get("model") or "").strip()
-    settings = load_settings()
+    settings = _settings()
     paths = settings.get("paths", {})
 
     transcripts_dir = Path(paths.get("transcripts", "/root/rcbot/downloads/transcripts")).expanduser()
@@ -641,14 +1000,7 @@ def summary_action():
     )
 
     def respond(message: str, ok: bool, status: int, extra: dict | None = None):
-        payload = {"ok": ok, "message": message, "file_name": file_name}
-        if extra:
-            payload.update(extra)
-
-        if request.is_json or request.accept_mimetypes["application/json"] >= request.accept_mimetypes["text/html"]:
-            return jsonify(payload), status
-        flash(message, "success" if ok else "warning")
-        return redirect(url_for("index"))
+        return _file_action_response(file_name, message, ok, status, extra)
 
     if not file_name:
         return respond("파일을 선택하세요.", False, 400)
@@ -707,13 +1059,13 @@ def summary_action():
             app.logger.exception("Summary worker failed for %s", file_name or "<missing>")
             tasks.update(task_id, status="failed", message=f"요약 처리 중 오류가 발생했습니다: {exc}")
 
-    threading.Thread(target=_run_summary, args=(task.id,), daemon=True).start()
+    _background.submit(_run_summary, task.id)
     return respond("요약 작업을 시작했습니다. 진행률을 확인하세요.", True, 202, {"task_id": task.id})
 
 
 @app.route("/api/sources/transcript")
 def transcript_sources_api():
-    settings = load_settings()
+    settings = _settings()
     return jsonify({"ok": True, "sources": _transcript_sources(settings)})
 
 
@@ -727,64 +1079,72 @@ def task_status(task_id: str):
 
 @app.route("/api/sources/summary")
 def summary_sources_api():
-    settings = load_settings()
+    settings = _settings()
     return jsonify({"ok": True, "sources": _summary_sources(settings)})
 
 
+def _paginate(items: list) -> tuple[list, dict]:
+    """Slice ``items`` by the optional ``offset``/``limit`` query arguments.
+
+    Without ``limit`` the whole list is returned, so existing callers keep
+    working; large folders can be fetched a page at a time instead.
+    """
+
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    limit = request.args.get("limit", type=int)
+    page = items[offset : offset + limit] if limit is not None and limit >= 0 else items[offset:]
+    return page, {"count": len(items), "offset": offset, "limit": limit}
+
+
 @app.route("/api/gdrive/folders")
 def gdrive_folders():
-    settings = load_settings()
-    folders, error = list_gdrive_folders(settings.get("auth", {}))
+    settings = _settings()
+    # Paged clients need the whole tree, not the picker's 200-folder cap.
+    limit = None if "limit" in request.args else 200
+    folders, error = list_gdrive_folders(settings.get("auth", {}), limit=limit)
 
     if error:
         return jsonify({"ok": False, "message": error}), 400
 
-    return jsonify({"ok": True, "folders": folders, "count": len(folders)})
+    page, meta = _paginate(folders)
+    return jsonify({"ok": True, "folders": page, **meta})
 
 
 @app.route("/api/local/download-folders")
 def local_folders():
-    settings = load_settings()
+    settings = _settings()
     base_dir = _downloads_root(settings)
     query = (request.args.get("q") or "").strip().lower()
-    if not base_dir.exists():
+    subdirs = _scan_names(base_dir, dirs=True)
+    if subdirs is None:
         return (
             jsonify({"ok": True, "folders": [], "base": str(base_dir), "query": query}),
             200,
         )
 
-    folders = []
-    for item in base_dir.iterdir():
-        if not item.is_dir():
-            continue
-
-        name = item.name
-        if query and query not in name.lower():
-            continue
-
-        folders.append(name)
-
-    return jsonify({"ok": True, "folders": sorted(folders), "base": str(base_dir), "query": query})
+    folders = [name for name in subdirs if query in name.lower()] if query else subdirs
+    page, meta = _paginate(folders)
+    return jsonify({"ok": True, "folders": page, "base": str(base_dir), "query": query, **meta})
 
 
 @app.route("/api/local/download-files")
 def local_files():
-    settings = load_settings()
-    base_dir = _downloads_root(settings).resolve()
+    base_dir = _resolved_paths()["downloads_root"]
     folder = (request.args.get("folder") or "").strip()
 
     if not folder:
         return jsonify({"ok": False, "message": "폴더를 선택하세요."}), 400
 
     target_dir = (base_dir / folder).resolve()
-    if not str(target_dir).startswith(str(base_dir)):
+    if not target_dir.is_relative_to(base_dir):
         return jsonify({"ok": False, "message": "허용된 다운로드 폴더 내에서만 조회할 수 있습니다."}), 400
 
-    if not target_dir.exists() or not target_dir.is_dir():
+    files = _scan_names(target_dir)
+    if files is None:
         return jsonify({"ok": False, "message": "선택한 폴더를 찾을 수 없습니다."}), 404
 
-    files = [item.name for item in target_dir.iterdir() if item.is_file()]
-    return jsonify({"ok": True, "files": sorted(files), "base": str(target_dir), "count": len(files)})
+    page, meta = _paginate(files)
+    return jsonify({"ok": True, "files": page, "base": str(target_dir), **meta})
 
 
 @app.route("/upload/manual", methods=["POST"])
@@ -796,19 +1156,32 @@ def manual_upload():
     if not local_dir:
         return jsonify({"ok": False, "message": "로컬 폴더를 선택하세요."}), 400
 
-    settings = load_settings()
-    base_dir = _downloads_root(settings).resolve()
+    settings = _settings()
+    base_dir = _resolved_paths()["downloads_root"]
     target_path = (base_dir / local_dir).resolve()
 
-    if not str(target_path).startswith(str(base_dir)):
+    if not target_path.is_relative_to(base_dir):
         return jsonify({"ok": False, "message": "허용된 다운로드 폴더 내부에서만 업로드할 수 있습니다."}), 400
 
     if not target_path.exists():
         return jsonify({"ok": False, "message": "선택한 로컬 경로가 존재하지 않습니다."}), 404
 
-    ok, message = upload_to_gdrive(target_path, remote_path, settings.get("auth", {}))
-    status = 200 if ok else 500
-    return jsonify({"ok": ok, "message": message}), status
+    # Folder uploads can take minutes; queue them and let the caller poll.
+    job_id = upload_to_gdrive_async(
+        target_path, remote_path, settings.get("auth", {}), tuning=settings.get("rclone")
+    )
+    return (
+        jsonify({"ok": True, "job_id": job_id, "message": "업로드를 시작했습니다."}),
+        202,
+    )
+
+
+@app.route("/upload/manual/<job_id>")
+def manual_upload_status(job_id: str):
+    state, message = upload_status(job_id)
+    if state == "unknown":
+        return jsonify({"ok": False, "message": "업로드 작업을 찾을 수 없습니다."}), 404
+    return jsonify({"ok": state != "failed", "state": state, "message": message})
 
 
 @app.route("/upload/manual/files", methods=["POST"])
@@ -824,33 +1197,36 @@ def manual_files_upload():
     if not files:
         return jsonify({"ok": False, "message": "업로드할 파일을 선택하세요."}), 400
 
-    settings = load_settings()
-    base_dir = _downloads_root(settings).resolve()
+    settings = _settings()
+    base_dir = _resolved_paths()["downloads_root"]
     target_dir = (base_dir / local_dir).resolve()
 
-    if not str(target_dir).startswith(str(base_dir)):
+    if not target_dir.is_relative_to(base_dir):
         return jsonify({"ok": False, "message": "허용된 다운로드 폴더 내부에서만 업로드할 수 있습니다."}), 400
 
-    if not target_dir.exists() or not target_dir.is_dir():
+    if not target_dir.is_dir():
         return jsonify({"ok": False, "message": "선택한 로컬 경로가 존재하지 않습니다."}), 404
 
-    uploaded: list[str] = []
+    file_paths: list[Path] = []
     for name in files:
         safe_name = Path(name).name
         if safe_name != name:
             return jsonify({"ok": False, "message": "잘못된 파일 이름이 포함되어 있습니다."}), 400
 
         file_path = target_dir / safe_name
-        if not file_path.exists() or not file_path.is_file():
+        if not file_path.is_file():
             return jsonify({"ok": False, "message": f"파일을 찾을 수 없습니다: {safe_name}"}), 404
+        file_paths.append(file_path)
 
-        ok, message = upload_to_gdrive(file_path, remote_path, settings.get("auth", {}))
-        if not ok:
-            return jsonify({"ok": False, "message": message}), 500
-        uploaded.append(safe_name)
+    # One rclone process for the whole batch; --transfers parallelises the files.
+    ok, message = upload_many_to_gdrive(
+        file_paths, remote_path, settings.get("auth", {}), tuning=settings.get("rclone")
+    )
+    if not ok:
+        return jsonify({"ok": False, "message": message}), 500
 
-    joined = ", ".join(uploaded)
-    return jsonify({"ok": True, "message": f"{len(uploaded)}개 파일을 업로드했습니다: {joined}"})
+    joined = ", ".join(path.name for path in file_paths)
+    return jsonify({"ok": True, "message": f"{len(file_paths)}개 파일을 업로드했습니다: {joined}"})
 
 
 @app.route("/upload/manual/file", methods=["POST"])
@@ -864,62 +1240,66 @@ def manual_file_upload():
     if not upload_file.filename:
         return jsonify({"ok": False, "message": "파일 이름이 비어 있습니다."}), 400
 
-    settings = load_settings()
-    base_dir = _downloads_root(settings).resolve()
-    base_dir.mkdir(parents=True, exist_ok=True)
-
+    settings = _settings()
     safe_name = secure_filename(upload_file.filename)
     if not safe_name:
         return jsonify({"ok": False, "message": "업로드 가능한 파일 이름이 아닙니다."}), 400
 
-    target_path = base_dir / safe_name
-    duplicate = 1
-    while target_path.exists():
-        target_path = base_dir / f"{Path(safe_name).stem}_{duplicate}{Path(safe_name).suffix}"
-        duplicate += 1
+    # Pipe the request body straight to rclone instead of saving a local copy
+    # and reading it back.
+    ok, message = upload_stream_to_gdrive(
+        upload_file.stream,
+        safe_name,
+        remote_path,
+        settings.get("auth", {}),
+        size=upload_file.content_length or None,
+    )
+    status = 200 if ok else 500
+    return jsonify({"ok": ok, "message": message}), status
 
-    try:
-        upload_file.save(target_path)
-        ok, message = upload_to_gdrive(target_path, remote_path, settings.get("auth", {}))
-        status = 200 if ok else 500
-        return jsonify({"ok": ok, "message": message}), status
-    finally:
-        if target_path.exists():
-            try:
-                target_path.unlink()
-            except OSError:
-                pass
+
+_SETTINGS_PATH_FIELDS = ("recordings", "captures", "downloads", "transcripts", "summaries")
 
 
 @app.route("/settings", methods=["POST"])
 def settings_action():
-    current = load_settings()
-    current.setdefault("paths", {})
-    current.setdefault("auth", {})
+    current = copy.deepcopy(_settings())
+    paths = current.setdefault("paths", {})
+    auth = current.setdefault("auth", {})
+    form = request.form
 
-    current["paths"]["recordings"] = request.form.get("recordings", current["paths"].get("recordings"))
-    current["paths"]["captures"] = request.form.get("captures", current["paths"].get("captures"))
-    current["paths"]["downloads"] = request.form.get("downloads", current["paths"].get("downloads"))
-    current["paths"]["transcripts"] = request.form.get("transcripts", current["paths"].get("transcripts"))
-    current["paths"]["summaries"] = request.form.get("summaries", current["paths"].get("summaries"))
+    for name in _SETTINGS_PATH_FIELDS:
+        value = form.get(name)
+        if value is not None:
+            paths[name] = value
 
-    current["auth"]["chatgpt_token"] = request.form.get("chatgpt_token", "")
-    current["auth"]["gdrive_remote"] = request.form.get("gdrive_remote", current["auth"].get("gdrive_remote", ""))
+    auth["chatgpt_token"] = form.get("chatgpt_token", "")
+    gdrive_remote = form.get("gdrive_remote")
+    if gdrive_remote is not None:
+        auth["gdrive_remote"] = gdrive_remote
 
     save_settings(current)
+    _SETTINGS_CACHE["mtime"] = None
+    g._settings = current
     flash("설정이 저장되었습니다.", "success")
     return redirect(url_for("index"))
 
 
+_NAV_LINKS: tuple[dict, ...] | None = None
+
+
 @app.context_processor
 def inject_nav():
-    nav_links = [
-        {"href": url_for("index") + "#live", "label": "라이브 녹화"},
-        {"href": url_for("index") + "#download-box", "label": "링크 다운로드"},
-        {"href": "#transcript", "label": "전사 및 요약"},
-        {"href": "#settings", "label": "설정"},
-    ]
-    return {"nav_links": nav_links}
+    global _NAV_LINKS
+    if _NAV_LINKS is None:
+        index_url = url_for("index")
+        _NAV_LINKS = (
+            {"href": index_url + "#live", "label": "라이브 녹화"},
+            {"href": index_url + "#download-box", "label": "링크 다운로드"},
+            {"href": "#transcript", "label": "전사 및 요약"},
+            {"href": "#settings", "label": "설정"},
+        )
+    return {"nav_links": _NAV_LINKS}
 
 
 @app.template_filter("percent_class")
@@ -931,14 +1311,79 @@ def percent_class(value: int) -> str:
     return "bg-warning"
 
 
+_SUGGESTED_IDEAS = (
+    "Google Drive 업로드 히스토리 로그",
+    "여러 요약 버전(짧게/길게) 병렬 생성",
+    "자동 재시도 스케줄링 및 이메일 알림",
+)
+
+
 @app.route("/ideas")
 def ideas():
-    suggested = [
-        "Google Drive 업로드 히스토리 로그",
-        "여러 요약 버전(짧게/길게) 병렬 생성",
-        "자동 재시도 스케줄링 및 이메일 알림",
-    ]
-    return {"ideas": suggested, "token": uuid.uuid4().hex}
+    return {"ideas": list(_SUGGESTED_IDEAS), "token": uuid.uuid4().hex}
+
+
+HTTP_WORKERS = int(os.getenv("HTTP_WORKERS", "16"))
+HTTP_IDLE_TIMEOUT = float(os.getenv("HTTP_IDLE_TIMEOUT", "30"))
+
+
+class IdleTimeoutRequestHandler(WSGIRequestHandler):
+    """Request handler that drops connections idle for ``HTTP_IDLE_TIMEOUT``.
+
+    With a fixed worker pool, a client that connects and never sends a
+    request would otherwise hold a worker forever.
+    """
+
+    timeout = HTTP_IDLE_TIMEOUT
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """Werkzeug server that handles requests on a fixed thread pool.
+
+    The stock threaded server starts a new thread per connection, so a burst
+    of task polling grows the thread count without bound; here extra
+    connections wait in the pool's queue instead. Each connection gets a
+    socket timeout so idle clients cannot starve the pool.
+    """
+
+    multithread = True
+
+    def __init__(self, *args, workers: int = HTTP_WORKERS, **kwargs) -> None:
+        kwargs.setdefault("handler", IdleTimeoutRequestHandler)
+        super().__init__(*args, **kwargs)
+        self._pool = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="ytweb-http")
+
+    def process_request(self, request, client_address) -> None:
+        self._pool.submit(self._handle_request, request, client_address)
+
+    def _handle_request(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # noqa: BLE001 - same reporting as socketserver
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
+
+def _serve(ssl_context: tuple[str, str] | None = None) -> None:
+    if DEBUG_MODE:
+        # Keep the reloader and debugger from the development server.
+        app.run(debug=True, host="0.0.0.0", port=6500, ssl_context=ssl_context)
+        return
+
+    # Warm up only in the serving process: importing the app (tests, CLI
+    # tools, a pre-forking WSGI master) must not load Whisper or touch CUDA.
+    if not _bool_env("WHISPER_NO_WARMUP"):
+        start_model_warmup()
+    server = PooledWSGIServer("0.0.0.0", 6500, app, ssl_context=ssl_context)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
 
 
 if __name__ == "__main__":
@@ -949,10 +1394,10 @@ if __name__ == "__main__":
         print(
             "USE_REVERSE_PROXY_SSL=true 로 설정되었습니다. NGINX가 TLS를 종료하고 Flask는 HTTP 6500 포트에서 동작합니다."
         )
-        app.run(debug=True, host="0.0.0.0", port=6500)
+        _serve()
     elif ssl_context:
         print("Starting HTTPS on port 6500 with provided certificates.")
-        app.run(debug=True, host="0.0.0.0", port=6500, ssl_context=ssl_context)
+        _serve(ssl_context)
     else:
         print("SSL_CERT_FILE 또는 SSL_KEY_FILE이 설정되지 않아 HTTP로 실행합니다.")
-        app.run(debug=True, host="0.0.0.0", port=6500)
+        _serve()
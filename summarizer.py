@@ -1,18 +1,38 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
 import os
+import tempfile
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # optional: faster encoding of large transcript payloads
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_SUMMARY_MODEL = os.getenv("SUMMARY_MODEL", "gpt-4o-mini")
 DEFAULT_SUMMARY_MAX_CHARS = int(os.getenv("SUMMARY_MAX_CHARS", "12000"))
 DEFAULT_OPENAI_BASE_URL = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
+STREAM_PROGRESS_INTERVAL = 1.0
+# Finished summaries are stored by a hash of the exact request, so summarising
+# the same transcript with the same model and prompts skips the API call.
+# Set SUMMARY_CACHE_DIR to an empty string to disable.
+SUMMARY_CACHE_DIR = os.getenv("SUMMARY_CACHE_DIR", str(Path(__file__).resolve().parent / ".summary_cache"))
+# Oldest entries (by mtime, refreshed on every hit) are pruned past this count.
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "500"))
 DEFAULT_SYSTEM_PROMPT = (
     "당신은 방송 전사를 간결하게 요약하는 한국어 어시스턴트입니다. "
     "핵심 사건과 시간 흐름을 유지하고, 중요한 발언자는 구분하세요."
@@ -23,34 +43,50 @@ DEFAULT_USER_PROMPT = (
 )
 
 
+def _build_session() -> requests.Session:
+    """Return a pooled session so repeated summaries reuse the TLS connection."""
+
+    # Completions are billed, so only retry when the request never reached the
+    # server (connect errors) or was rejected before running (429).
+    retry = Retry(
+        total=2,
+        connect=2,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(429,),
+        allowed_methods=frozenset({"POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
+_SESSION = _build_session()
+
+
 def _parse_models(value: str | None) -> list[str]:
     if not value:
         return []
-    models = [item.strip() for item in value.split(",") if item.strip()]
-    # Preserve order while removing duplicates
-    seen = set()
-    unique_models: list[str] = []
-    for model in models:
-        if model not in seen:
-            seen.add(model)
-            unique_models.append(model)
-    return unique_models
+    # dict.fromkeys preserves order while removing duplicates
+    return list(dict.fromkeys(item.strip() for item in value.split(",") if item.strip()))
 
 
-def available_summary_models() -> list[str]:
+@functools.lru_cache(maxsize=1)
+def _available_summary_models() -> tuple[str, ...]:
     env_models = _parse_models(os.getenv("SUMMARY_MODELS"))
     if env_models:
-        return env_models
+        return tuple(env_models)
 
-    fallback = [DEFAULT_SUMMARY_MODEL, "gpt-4o", "o1-mini"]
-    # Remove duplicates while keeping order
-    seen = set()
-    unique_fallback: list[str] = []
-    for model in fallback:
-        if model not in seen:
-            seen.add(model)
-            unique_fallback.append(model)
-    return unique_fallback
+    return tuple(dict.fromkeys([DEFAULT_SUMMARY_MODEL, "gpt-4o", "o1-mini"]))
+
+
+def available_summary_models() -> list[str]:
+    """Return configured summary models; the environment is parsed once."""
+
+    return list(_available_summary_models())
 
 
 @dataclass
@@ -65,10 +101,20 @@ class SummaryResult:
 
 
 def _prepare_transcript_text(path: Path, *, max_chars: int | None = None) -> tuple[str, bool]:
-    text = path.read_text(encoding="utf-8", errors="ignore")
-    if max_chars and len(text) > max_chars:
-        return text[:max_chars], True
-    return text, False
+    if not max_chars:
+        return path.read_text(encoding="utf-8", errors="ignore"), False
+
+    # Text-mode read(n) decodes incrementally and stops after n characters, so
+    # the tail of a long transcript is never loaded.
+    with path.open("r", encoding="utf-8", errors="ignore") as handle:
+        text = handle.read(max_chars)
+        truncated = handle.read(1) != ""
+    return text, truncated
+
+
+@functools.lru_cache(maxsize=8)
+def _read_prompt_file(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
 
 
 def _load_prompt_from_env(var_name: str, default: str) -> str:
@@ -77,9 +123,10 @@ def _load_prompt_from_env(var_name: str, default: str) -> str:
         return default
 
     path = Path(value)
-    if path.exists() and path.is_file():
+    if path.is_file():
         try:
-            return path.read_text(encoding="utf-8")
+            # Keyed by mtime so edits to the prompt file are still picked up.
+            return _read_prompt_file(str(path), path.stat().st_mtime_ns)
         except OSError:
             logger.warning("%s에 지정된 프롬프트 파일을 읽지 못했습니다. 기본값을 사용합니다.", var_name)
             return default
@@ -87,32 +134,56 @@ def _load_prompt_from_env(var_name: str, default: str) -> str:
     return value
 
 
-def _render_user_prompt(template: str, transcript_text: str) -> str:
+@functools.lru_cache(maxsize=8)
+def _compile_user_template(template: str) -> tuple[str, ...]:
+    """Split a user prompt template around the transcript insertion points."""
+
     if "{transcript}" in template:
-        return template.replace("{transcript}", transcript_text)
+        return tuple(template.split("{transcript}"))
+
+    return (f"{template.rstrip()}\n\n전사 내용:\n", "")
+
+
+def _render_user_prompt(template: str, transcript_text: str) -> str:
+    return transcript_text.join(_compile_user_template(template))
+
+
+@functools.lru_cache(maxsize=8)
+def _system_message(system_prompt: str) -> dict[str, str]:
+    return {"role": "system", "content": system_prompt}
+
 
-    return f"{template.rstrip()}\n\n전사 내용:\n{transcript_text}"
+def _stream_usage_supported(url: str) -> bool:
+    """Whether to send ``stream_options``; many compatible servers reject it.
 
+    Defaults to OpenAI's own API only; SUMMARY_STREAM_USAGE=true/false overrides.
+    """
 
-def _build_openai_request(model: str, transcript_text: str) -> dict[str, Any]:
+    override = os.getenv("SUMMARY_STREAM_USAGE", "").strip().lower()
+    if override:
+        return override in {"1", "true", "yes", "on"}
+    return urlsplit(url).hostname == "api.openai.com"
+
+
+def _build_openai_request(model: str, transcript_text: str, *, include_usage: bool) -> dict[str, Any]:
     system_prompt = _load_prompt_from_env("SUMMARY_SYSTEM_PROMPT", DEFAULT_SYSTEM_PROMPT)
     user_template = _load_prompt_from_env("SUMMARY_USER_PROMPT", DEFAULT_USER_PROMPT)
-    user_prompt = _render_user_prompt(user_template, transcript_text)
 
-    return {
+    payload: dict[str, Any] = {
         "model": model,
         "temperature": 0.2,
+        "stream": True,
         "messages": [
-            {
-                "role": "system",
-                "content": system_prompt,
-            },
+            _system_message(system_prompt),
             {
                 "role": "user",
-                "content": user_prompt,
+                "content": _render_user_prompt(user_template, transcript_text),
             },
         ],
     }
+    if include_usage:
+        payload["stream_options"] = {"include_usage": True}
+    return payload
 
 
 def summarize_transcript(
@@ -129,7 +200,7 @@ def summarize_transcript(
     if not api_key:
         return None, "ChatGPT API 토큰을 설정한 뒤 다시 시도하세요."
 
-    if not transcript_path.exists() or not transcript_path.is_file():
+    if not transcript_path.is_file():
         return None, "요약할 전사 파일을 찾을 수 없습니다."
 
     if progress_callback:
@@ -138,44 +209,197 @@ def summarize_transcript(
     snippet, truncated = _prepare_transcript_text(transcript_path, max_chars=max_chars)
     if progress_callback:
         progress_callback(0.2, "요약 프롬프트를 준비하는 중...")
+
+    return _summarize_snippet(
+        snippet,
+        truncated,
+        api_key=api_key,
+        model=model,
+        max_chars=max_chars,
+        api_base=api_base,
+        progress_callback=progress_callback,
+    )
+
+
+def _cache_path(url: str, payload: dict[str, Any]) -> Path | None:
+    if not SUMMARY_CACHE_DIR:
+        return None
+    if orjson is not None:
+        encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    digest = hashlib.sha256(url.encode("utf-8") + b"\0" + encoded).hexdigest()
+    return Path(SUMMARY_CACHE_DIR).expanduser() / f"{digest}.json"
+
+
+def _load_cached_summary(path: Path | None) -> dict[str, Any] | None:
+    if path is None:
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not (isinstance(data, dict) and data.get("content")):
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return data
+
+
+def _store_cached_summary(path: Path | None, entry: dict[str, Any]) -> None:
+    if path is None:
+        return
+    temp_path: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(entry, handle, ensure_ascii=False)
+        os.replace(temp_path, path)
+        temp_path = None
+    except OSError:
+        logger.warning("요약 캐시를 저장하지 못했습니다: %s", path, exc_info=True)
+    finally:
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+    _prune_summary_cache(path.parent)
+
+
+def _prune_summary_cache(directory: Path) -> None:
+    if SUMMARY_CACHE_MAX_ENTRIES <= 0:
+        return
+    entries = []
+    for candidate in directory.glob("*.json"):
+        try:
+            entries.append((candidate.stat().st_mtime, candidate))
+        except OSError:
+            continue  # removed by a concurrent prune
+    if len(entries) <= SUMMARY_CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, stale in entries[: len(entries) - SUMMARY_CACHE_MAX_ENTRIES]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def _read_stream(
+    response: requests.Response, progress_callback: Callable[[float, str], None] | None
+) -> tuple[str, str | None, dict[str, Any]]:
+    """Collect a server-sent-events completion, reporting partial text as it arrives."""
+
+    parts: list[str] = []
+    received = 0
+    model: str | None = None
+    usage: dict[str, Any] = {}
+    last_emit_at = time.monotonic()
+
+    for line in response.iter_lines():
+        if not line.startswith(b"data: "):
+            continue
+        data = line[6:]
+        if data == b"[DONE]":
+            break
+        event = orjson.loads(data) if orjson is not None else json.loads(data)
+        model = event.get("model") or model
+        usage = event.get("usage") or usage
+        for choice in event.get("choices") or ():
+            delta = (choice.get("delta") or {}).get("content")
+            if delta:
+                parts.append(delta)
+                received += len(delta)
+
+        if progress_callback and parts:
+            now = time.monotonic()
+            if now - last_emit_at >= STREAM_PROGRESS_INTERVAL:
+                last_emit_at = now
+                tail = "".join(parts[-8:]).strip().replace("\n", " ")
+                preview = tail if len(tail) <= 40 else f"…{tail[-40:]}"
+                # The final length is unknown, so approach 0.85 as text accumulates.
+                progress = 0.4 + 0.45 * received / (received + 1500)
+                progress_callback(progress, f"요약 생성 중 ({received}자): {preview}")
+
+    return "".join(parts), model, usage
+
+
+def _summarize_snippet(
+    snippet: str,
+    truncated: bool,
+    *,
+    api_key: str,
+    model: str | None,
+    max_chars: int | None,
+    api_base: str | None,
+    progress_callback: Callable[[float, str], None] | None = None,
+) -> tuple[SummaryResult | None, str | None]:
     target_model = model or DEFAULT_SUMMARY_MODEL
 
     url = (api_base.rstrip("/") if api_base else DEFAULT_OPENAI_BASE_URL.rstrip("/")) + "/chat/completions"
-    payload = _build_openai_request(target_model, snippet)
+    payload = _build_openai_request(target_model, snippet, include_usage=_stream_usage_supported(url))
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
 
+    cache_path = _cache_path(url, payload)
+    cached = _load_cached_summary(cache_path)
+    if cached is not None:
+        if progress_callback:
+            progress_callback(1.0, "같은 요청의 저장된 요약을 사용했습니다.")
+        return (
+            SummaryResult(
+                content=cached["content"],
+                model=cached.get("model") or target_model,
+                truncated=truncated,
+                input_characters=len(snippet),
+                max_characters=max_chars,
+                prompt_tokens=cached.get("prompt_tokens"),
+                completion_tokens=cached.get("completion_tokens"),
+            ),
+            None,
+        )
+
     try:
         if progress_callback:
             progress_callback(0.35, "OpenAI API로 요청을 전송했습니다. 응답을 기다리는 중...")
-        response = requests.post(url, headers=headers, json=payload, timeout=120)
+        if orjson is not None:
+            response = _SESSION.post(url, headers=headers, data=orjson.dumps(payload), timeout=120, stream=True)
+        else:
+            response = _SESSION.post(url, headers=headers, json=payload, timeout=120, stream=True)
     except requests.RequestException as exc:  # noqa: BLE001 - surfaced to user
         logger.exception("OpenAI request failed")
         if progress_callback:
             progress_callback(0.0, "요약 요청 중 오류가 발생했습니다.")
         return None, f"요약 요청 중 오류가 발생했습니다: {exc}"
 
-    if response.status_code >= 300:
-        try:
-            detail = response.json().get("error", {}).get("message")
-        except Exception:  # noqa: BLE001 - safe fallback
-            detail = response.text
-        logger.error("OpenAI API error %s: %s", response.status_code, detail)
-        if progress_callback:
-            progress_callback(0.0, "요약 응답을 받지 못했습니다.")
-        return None, detail or "요약 응답을 받지 못했습니다."
-
-    try:
-        data = response.json()
-        content = (
-            data.get("choices", [{}])[0]
-            .get("message", {})
-            .get("content", "")
-            .strip()
-        )
-        usage = data.get("usage", {}) if isinstance(data, dict) else {}
-    except ValueError:
-        return None, "요약 응답을 해석하지 못했습니다."
+    with response:
+        if response.status_code >= 300:
+            try:
+                detail = response.json().get("error", {}).get("message")
+            except Exception:  # noqa: BLE001 - safe fallback
+                detail = response.text
+            logger.error("OpenAI API error %s: %s", response.status_code, detail)
+            if progress_callback:
+                progress_callback(0.0, "요약 응답을 받지 못했습니다.")
+            return None, detail or "요약 응답을 받지 못했습니다."
 
+        try:
+            if response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                content, response_model, usage = _read_stream(response, progress_callback)
+            else:
+                # Some OpenAI-compatible servers ignore "stream" and answer in one body.
+                data = response.json()
+                content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+                response_model = data.get("model")
+                usage = data.get("usage") or {}
+        except (ValueError, requests.RequestException):
+            logger.exception("OpenAI response could not be read")
+            return None, "요약 응답을 해석하지 못했습니다."
+
+    content = content.strip()
     if progress_callback:
         progress_callback(0.9, "요약 결과를 정리하는 중...")
 
@@ -184,18 +408,26 @@ def summarize_transcript(
             progress_callback(0.0, "빈 요약 결과가 반환되었습니다.")
         return None, "빈 요약 결과가 반환되었습니다."
 
+    result = SummaryResult(
+        content=content,
+        model=response_model or target_model,
+        truncated=truncated,
+        input_characters=len(snippet),
+        max_characters=max_chars,
+        prompt_tokens=usage.get("prompt_tokens"),
+        completion_tokens=usage.get("completion_tokens"),
+    )
+    _store_cached_summary(
+        cache_path,
+        {
+            "content": result.content,
+            "model": result.model,
+            "prompt_tokens": result.prompt_tokens,
+            "completion_tokens": result.completion_tokens,
+        },
+    )
+
     if progress_callback:
         progress_callback(1.0, "요약을 완료했습니다.")
 
-    return (
-        SummaryResult(
-            content=content,
-            model=data.get("model", target_model),
-            truncated=truncated,
-            input_characters=len(snippet),
-            max_characters=max_chars,
-            prompt_tokens=usage.get("prompt_tokens"),
-            completion_tokens=usage.get("completion_tokens"),
-        ),
-        None,
-    )
+    return result, None
@@ -1,5 +1,6 @@
 from pathlib import Path
 import importlib
+import types
 
 import pytest
 
@@ -41,9 +42,11 @@ def test_yt_download_fallback_without_ffmpeg(monkeypatch, tmp_path, bot_module):
         if out_path:
             out_path.parent.mkdir(parents=True, exist_ok=True)
             out_path.write_bytes(b"data")
+            return 0, f"{out_path}\n", ""
         return 0, "", ""
 
     monkeypatch.setattr(bot_module, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(bot_module, "yt_dlp", None)
     monkeypatch.setattr(bot_module, "_ffmpeg_available", lambda: True)
 
     result, error = bot_module.yt_download("https://www.youtube.com/watch?v=abcdefghijk", tmp_path)
@@ -53,3 +56,59 @@ def test_yt_download_fallback_without_ffmpeg(monkeypatch, tmp_path, bot_module):
     assert result.exists()
     assert any("--remux-video" in cmd for cmd in attempts)
     assert any("--remux-video" not in cmd for cmd in attempts)
+    assert all("after_move:filepath" in cmd for cmd in attempts)
+
+
+def test_yt_download_uses_python_api(monkeypatch, tmp_path, bot_module):
+    calls = []
+
+    class FakeDownloadError(Exception):
+        pass
+
+    class FakeYoutubeDL:
+        def __init__(self, opts):
+            self.opts = opts
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def extract_info(self, url, download=True):
+            calls.append(self.opts)
+            if "postprocessors" in self.opts:
+                raise FakeDownloadError("ffmpeg not found")
+            out_path = Path(self.opts["outtmpl"]["default"].replace("%(title).80B", "SampleTitle"))
+            out_path.write_bytes(b"data")
+            return {"title": "SampleTitle", "requested_downloads": [{"filepath": str(out_path)}]}
+
+    fake_module = types.SimpleNamespace(
+        YoutubeDL=FakeYoutubeDL, utils=types.SimpleNamespace(DownloadError=FakeDownloadError)
+    )
+    monkeypatch.setattr(bot_module, "yt_dlp", fake_module)
+    monkeypatch.setattr(bot_module, "_ffmpeg_path", lambda: tmp_path / "ffmpeg")
+    monkeypatch.setattr(
+        bot_module, "run_cmd", lambda *a, **k: pytest.fail("yt-dlp CLI should not be used")
+    )
+
+    result, error = bot_module.yt_download("https://www.youtube.com/watch?v=abcdefghijk", tmp_path)
+
+    assert error is None
+    assert result is not None and result.exists()
+    assert calls[0]["postprocessors"][0]["key"] == "FFmpegVideoRemuxer"
+    assert "postprocessors" not in calls[-1]
+
+
+
+def test_extract_info_reports_unexpected_errors(monkeypatch, bot_module):
+    class BrokenClient:
+        def extract_info(self, url, download=False):
+            raise KeyError("formats")
+
+    monkeypatch.setattr(bot_module, "_ydl_info_client", lambda: BrokenClient())
+
+    info, error = bot_module._yt_extract_info("https://youtu.be/broken")
+
+    assert info is None
+    assert error == "'formats'"
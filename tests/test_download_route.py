@@ -0,0 +1,76 @@
+import importlib
+import types
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def app_module():
+    return importlib.import_module("app")
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path, app_module):
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"data")
+    calls = {}
+
+    def record(name, result):
+        def _fake(*args, **kwargs):
+            calls.setdefault(name, []).append(args)
+            return result
+
+        return _fake
+
+    monkeypatch.setattr(app_module, "_background", types.SimpleNamespace(submit=lambda fn, *a: fn(*a)))
+    monkeypatch.setattr(app_module, "yt_download", record("download", (media, None)))
+    monkeypatch.setattr(app_module, "upload_to_gdrive", record("upload", (True, "uploaded")))
+    monkeypatch.setattr(app_module, "transcribe_file", record("transcribe", (tmp_path / "clip.txt", None)))
+    monkeypatch.setattr(app_module, "fetch_video_title", lambda url: ("Sample", None))
+    monkeypatch.setattr(app_module, "yt_pipe_to_gdrive", record("pipe", (True, "piped", "Sample.ts")))
+
+    def post(**payload):
+        response = app_module.app.test_client().post("/download", json={"video_url": "https://youtu.be/x", **payload})
+        task = app_module.tasks.get(response.get_json()["task_id"])
+        return task, calls
+
+    return post
+
+
+def test_download_only(client):
+    task, calls = client()
+
+    assert task.status == "completed"
+    assert set(calls) == {"download"}
+
+
+def test_download_then_upload(client):
+    task, calls = client(upload_remote="shows")
+
+    assert task.status == "completed"
+    assert calls["upload"][0][1] == "shows"
+    assert "transcribe" not in calls
+
+
+def test_download_then_transcribe(client):
+    task, calls = client(transcribe=True)
+
+    assert task.status == "completed"
+    assert "transcribe" in calls
+    assert "upload" not in calls
+
+
+def test_skip_local_streams_upload(client):
+    task, calls = client(upload_remote="shows", skip_local=True)
+
+    assert task.status == "completed"
+    assert task.detail == "Sample.ts"
+    assert set(calls) == {"pipe"}
+
+
+def test_skip_local_keeps_copy_for_transcription(client):
+    task, calls = client(upload_remote="shows", skip_local=True, transcribe=True)
+
+    assert task.status == "completed"
+    assert "pipe" not in calls
+    assert {"download", "upload", "transcribe"} <= set(calls)
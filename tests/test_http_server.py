@@ -0,0 +1,26 @@
+import importlib
+import socket
+import threading
+import urllib.request
+
+
+def test_idle_client_does_not_starve_the_pool():
+    app_module = importlib.import_module("app")
+
+    class QuickTimeout(app_module.IdleTimeoutRequestHandler):
+        timeout = 0.5
+
+    server = app_module.PooledWSGIServer("127.0.0.1", 0, app_module.app, workers=1, handler=QuickTimeout)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        idle = socket.create_connection(("127.0.0.1", server.server_port))
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/api/sources/summary"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                assert response.status == 200
+        finally:
+            idle.close()
+    finally:
+        server.shutdown()
+        server.server_close()
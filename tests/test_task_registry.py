@@ -0,0 +1,15 @@
+import importlib
+from datetime import timedelta
+
+
+def test_stuck_task_does_not_block_expiry():
+    app_module = importlib.import_module("app")
+    registry = app_module.TaskRegistry(ttl=timedelta(0))
+    stuck = registry.create("download", "stuck")
+    done = registry.create("download", "done")
+    registry.update(done.id, status="completed")
+
+    registry.create("download", "new")
+
+    assert registry.get(stuck.id) is not None
+    assert registry.get(done.id) is None
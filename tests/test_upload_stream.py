@@ -0,0 +1,92 @@
+import importlib
+import io
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def bot_module():
+    return importlib.import_module("youtube_recorder_bot")
+
+
+def _stub_rclone(tmp_path, body):
+    script = tmp_path / "rclone"
+    script.write_text(f"#!{sys.executable}\nimport sys\n{body}\n")
+    script.chmod(0o755)
+    return script
+
+
+@pytest.fixture
+def fake_drive(monkeypatch, bot_module):
+    monkeypatch.setattr(bot_module, "acquire_gdrive_access", lambda auth: (True, None))
+
+
+def test_upload_stream_pipes_bytes_into_rclone(monkeypatch, tmp_path, bot_module, fake_drive):
+    received = tmp_path / "received.bin"
+    script = _stub_rclone(tmp_path, f"open({str(received)!r}, 'wb').write(sys.stdin.buffer.read())")
+    monkeypatch.setattr(bot_module, "RCLONE_BIN", str(script))
+
+    ok, message = bot_module.upload_stream_to_gdrive(io.BytesIO(b"payload"), "clip.mp4", "dest", {})
+
+    assert ok, message
+    assert received.read_bytes() == b"payload"
+
+
+def test_upload_stream_reports_rclone_stderr(monkeypatch, tmp_path, bot_module, fake_drive):
+    script = _stub_rclone(tmp_path, "sys.stderr.write('quota exceeded')\nsys.exit(1)")
+    monkeypatch.setattr(bot_module, "RCLONE_BIN", str(script))
+
+    ok, message = bot_module.upload_stream_to_gdrive(
+        io.BytesIO(b"x" * (4 * 1024 * 1024)), "clip.mp4", "dest", {}
+    )
+
+    assert not ok
+    assert message == "quota exceeded"
+
+
+def test_upload_stream_survives_chatty_rclone(monkeypatch, tmp_path, bot_module, fake_drive):
+    # More stderr than a pipe buffers, written before rclone reads stdin.
+    script = _stub_rclone(tmp_path, "sys.stderr.write('progress\\n' * 32768)\nsys.stdin.buffer.read()\nsys.exit(1)")
+    monkeypatch.setattr(bot_module, "RCLONE_BIN", str(script))
+
+    ok, message = bot_module.upload_stream_to_gdrive(
+        io.BytesIO(b"x" * (4 * 1024 * 1024)), "clip.mp4", "dest", {}
+    )
+
+    assert not ok
+    assert message.endswith("progress")
+
+
+def test_pipe_upload_reports_failing_rclone(monkeypatch, tmp_path, bot_module, fake_drive):
+    downloader = tmp_path / "yt-dlp"
+    downloader.write_text(
+        f"#!{sys.executable}\nimport sys\n"
+        "sys.stderr.write('yt-dlp: broken pipe\\n')\n"
+        "sys.stdout.buffer.write(b'x' * 1024)\nsys.exit(1)\n"
+    )
+    downloader.chmod(0o755)
+    script = _stub_rclone(tmp_path, "sys.stdin.buffer.read()\nsys.stderr.write('quota exceeded')\nsys.exit(1)")
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    monkeypatch.setattr(bot_module, "RCLONE_BIN", str(script))
+    monkeypatch.setattr(bot_module, "_ffmpeg_path", lambda: None)
+
+    ok, message, file_name = bot_module.yt_pipe_to_gdrive("https://youtu.be/x", "clip", "dest", {})
+
+    assert not ok
+    assert message == "quota exceeded"
+    assert file_name == "clip.mp4"
+
+
+def test_running_upload_does_not_block_expiry(monkeypatch, bot_module):
+    running, finished = Future(), Future()
+    finished.set_result((True, "ok"))
+    jobs = OrderedDict(running=(0.0, running), finished=(0.0, finished))
+    monkeypatch.setattr(bot_module, "_UPLOAD_JOBS", jobs)
+
+    bot_module._expire_upload_jobs(bot_module.UPLOAD_JOB_TTL + 1)
+
+    assert list(jobs) == ["running"]
@@ -1,19 +1,32 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import stat
 import subprocess
 import tempfile
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Dict, Tuple
 
-from faster_whisper import WhisperModel
+import ctranslate2
+import numpy
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.audio import decode_audio
 
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_RATE = 16000
+PROGRESS_INTERVAL = 0.5
+# The batched pipeline already packs VAD regions into <=30 s windows; longer
+# silences and a little padding give it fewer, fuller regions to pack.
+BATCHED_VAD_PARAMETERS = {"min_silence_duration_ms": 500, "speech_pad_ms": 200}
+
 
 def _bool_env(key: str, default: bool = False) -> bool:
     value = os.getenv(key)
@@ -32,26 +45,65 @@ def _int_env(key: str, default: int) -> int:
         return default
 
 
+@functools.lru_cache(maxsize=4096)
+def _hhmm_prefix(total_minutes: int) -> str:
+    hours, minutes = divmod(total_minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:"
+
+
 def _format_timestamp(seconds: float | None) -> str:
     if seconds is None:
         return "--:--"
 
     total_seconds = int(seconds)
-    hours, remainder = divmod(total_seconds, 3600)
-    minutes, secs = divmod(remainder, 60)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    minutes, secs = divmod(total_seconds, 60)
+    return f"{_hhmm_prefix(minutes)}{secs:02d}"
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    # The first device query initialises the CUDA driver; every WhisperOptions()
+    # without an explicit compute type asks, so answer once per process.
+    try:
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:  # noqa: BLE001 - CPU-only builds may raise instead of returning 0
+        return False
+
+
+def _auto_compute_type(device: str) -> str:
+    """Pick a quantization that suits the device when none is configured.
+
+    On CUDA ``float16`` runs entirely on the tensor cores without a dequant
+    step; on CPU plain ``int8`` is the fastest option.
+    """
+
+    device = device.strip().lower()
+    if device == "cuda" or (device == "auto" and _cuda_available()):
+        return "float16"
+    return "int8"
 
 
 @dataclass
 class WhisperOptions:
     model_size: str = os.getenv("WHISPER_MODEL", "base")
     device: str = os.getenv("WHISPER_DEVICE", "auto")
-    compute_type: str = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
+    compute_type: str = os.getenv("WHISPER_COMPUTE_TYPE", "")
     beam_size: int = _int_env("WHISPER_BEAM_SIZE", 5)
     vad_filter: bool = _bool_env("WHISPER_VAD_FILTER", True)
+    num_workers: int = _int_env("WHISPER_NUM_WORKERS", 2)
+    cpu_threads: int = _int_env("WHISPER_CPU_THREADS", max(1, (os.cpu_count() or 2) // 2))
+    batch_size: int = _int_env("WHISPER_BATCH", 8)
+    download_root: str | None = os.getenv("WHISPER_DOWNLOAD_ROOT") or None
+
+    def __post_init__(self) -> None:
+        if not self.compute_type:
+            self.compute_type = _auto_compute_type(self.device)
 
 
+# Models are loaded once per process and shared by every transcription.
 _MODEL_CACHE: Dict[Tuple[str, str, str], WhisperModel] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+_PIPELINE_CACHE: Dict[Tuple[str, str, str], BatchedInferencePipeline] = {}
 
 
 def _probe_audio_duration(path: Path) -> float | None:
@@ -94,58 +146,183 @@ def _emit_progress(
 
 
 def _load_model(options: WhisperOptions) -> WhisperModel:
-    key = (options.model_size, options.device, options.compute_type)
-    if key not in _MODEL_CACHE:
-        _MODEL_CACHE[key] = WhisperModel(
-            options.model_size,
-            device=options.device,
-            compute_type=options.compute_type,
-        )
-    return _MODEL_CACHE[key]
+    key = (options.model_size, options.device.strip().lower(), options.compute_type.strip().lower())
+    model = _MODEL_CACHE.get(key)
+    if model is not None:
+        return model
 
+    with _MODEL_CACHE_LOCK:
+        if key not in _MODEL_CACHE:
+            try:
+                _MODEL_CACHE[key] = _build_model(options, key[1], key[2])
+            except (RuntimeError, ValueError):
+                if key[1] == "cpu":
+                    raise
+                # Broken drivers or a full GPU should degrade to CPU rather
+                # than fail every job; the fallback is cached under the same key.
+                logger.warning("Whisper model failed to load on %s; falling back to CPU int8", key[1], exc_info=True)
+                _MODEL_CACHE[key] = _build_model(options, "cpu", "int8")
+        return _MODEL_CACHE[key]
+
+
+def _build_model(options: WhisperOptions, device: str, compute_type: str) -> WhisperModel:
+    return WhisperModel(
+        options.model_size,
+        device=device,
+        compute_type=compute_type,
+        num_workers=max(options.num_workers, 1),
+        cpu_threads=max(options.cpu_threads, 0),
+        download_root=options.download_root,
+    )
+
+
+def _load_pipeline(options: WhisperOptions) -> BatchedInferencePipeline:
+    model = _load_model(options)
+    key = (options.model_size, options.device.strip().lower(), options.compute_type.strip().lower())
+    with _MODEL_CACHE_LOCK:
+        if key not in _PIPELINE_CACHE:
+            _PIPELINE_CACHE[key] = BatchedInferencePipeline(model=model)
+        return _PIPELINE_CACHE[key]
+
+
+# faster-whisper always builds its Silero VAD session on the CPU provider; on
+# GPU hosts the VAD then becomes the long pole of batched decoding.
+_VAD_ACCELERATORS = ("CUDAExecutionProvider", "CoreMLExecutionProvider")
+# Silero VAD weights bundled with faster-whisper, keyed by the SileroVADModel
+# attribute that holds each session: 1.2 ships one model, 1.1 an
+# encoder/decoder pair.
+_VAD_SESSION_FILES = (
+    {"session": "silero_vad_v6.onnx"},
+    {"encoder_session": "silero_encoder_v5.onnx", "decoder_session": "silero_decoder_v5.onnx"},
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _move_vad_to_accelerator() -> None:
+    """Rebuild the shared VAD session(s) on CUDA/CoreML when onnxruntime has one.
+
+    The tiny LSTM gains nothing from extra CPU threads (they only add
+    contention with CTranslate2), so CPU-only hosts keep the stock session.
+    """
 
-def _extract_audio_with_ffmpeg(source_path: Path) -> tuple[Path | None, str | None]:
     try:
-        temp_file = tempfile.NamedTemporaryFile(
-            suffix=".wav", prefix=f"{source_path.stem}_", dir=source_path.parent, delete=False
+        import onnxruntime
+        from faster_whisper.utils import get_assets_path
+        from faster_whisper.vad import get_vad_model
+
+        available = set(onnxruntime.get_available_providers())
+        providers = [name for name in _VAD_ACCELERATORS if name in available]
+        if not providers:
+            return
+
+        assets = Path(get_assets_path())
+        model = get_vad_model()
+        layout = next(
+            (
+                files
+                for files in _VAD_SESSION_FILES
+                if all(hasattr(model, attr) and (assets / name).is_file() for attr, name in files.items())
+            ),
+            None,
         )
-        temp_path = Path(temp_file.name)
-        temp_file.close()
-    except Exception as exc:  # noqa: BLE001 - surfaced to caller for user feedback
-        return None, f"임시 오디오 파일을 만들지 못했습니다: {exc}"
+        if layout is None:
+            logger.warning("Unknown Silero VAD layout in %s; keeping the CPU session", assets)
+            return
+
+        sess_options = onnxruntime.SessionOptions()
+        sess_options.inter_op_num_threads = 1
+        sess_options.intra_op_num_threads = 1
+        sess_options.enable_cpu_mem_arena = False
+        sess_options.log_severity_level = 4
+        for attr, name in layout.items():
+            session = onnxruntime.InferenceSession(
+                str(assets / name), providers=[*providers, "CPUExecutionProvider"], sess_options=sess_options
+            )
+            setattr(model, attr, session)
+    except Exception:  # noqa: BLE001 - keep faster-whisper's own session
+        logger.warning("Could not move the VAD session to an accelerator", exc_info=True)
 
-    try:
-        result = subprocess.run(
-            [
-                "ffmpeg",
-                "-y",
-                "-loglevel",
-                "error",
-                "-i",
-                str(source_path),
-                "-vn",
-                "-acodec",
-                "pcm_s16le",
-                "-ar",
-                "16000",
-                "-ac",
-                "1",
-                str(temp_path),
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True,
+
+def _run_whisper(options: WhisperOptions, audio):
+    """Start a transcription and return the lazy segment generator.
+
+    With ``batch_size > 1`` VAD-split chunks are padded and decoded together,
+    which keeps the GPU/SIMD lanes busy on long recordings. Batched decoding
+    always uses VAD and does not condition on previous text, which also
+    avoids repetition loops on long inputs.
+    """
+
+    if options.batch_size > 1 or options.vad_filter:
+        _move_vad_to_accelerator()
+
+    if options.batch_size > 1:
+        segments, _ = _load_pipeline(options).transcribe(
+            audio,
+            batch_size=options.batch_size,
+            beam_size=options.beam_size,
+            vad_filter=True,
+            vad_parameters=dict(BATCHED_VAD_PARAMETERS),
+            condition_on_previous_text=False,
         )
-    except FileNotFoundError:
-        temp_path.unlink(missing_ok=True)
-        return None, "ffmpeg를 찾을 수 없습니다. 녹화 서버에 ffmpeg가 설치되어 있는지 확인하세요."
-    except subprocess.CalledProcessError as exc:  # noqa: BLE001 - surfaced to caller for user feedback
-        temp_path.unlink(missing_ok=True)
-        detail = (exc.stderr or "").strip() or (result.stderr if "result" in locals() else "")
-        return None, f"오디오 추출에 실패했습니다. 파일이 손상되었을 수 있습니다: {detail}"
+        return segments
+
+    segments, _ = _load_model(options).transcribe(
+        audio, beam_size=options.beam_size, vad_filter=options.vad_filter
+    )
+    return segments
 
-    return temp_path, None
+
+def _load_audio_16k(source_path: Path) -> tuple[numpy.ndarray | None, str | None]:
+    """Decode to 16 kHz mono float32 samples and memory-map them.
+
+    ffmpeg writes raw samples to an unlinked temporary file instead of a
+    pipe, so an hour of audio (~230 MB) is paged in on demand rather than
+    held once as ``bytes`` and again while the pipe output is joined.
+    """
+
+    fd, raw_path = tempfile.mkstemp(prefix="whisper-", suffix=".f32")
+    os.close(fd)
+    try:
+        try:
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-loglevel",
+                    "error",
+                    "-threads",
+                    "0",
+                    "-i",
+                    str(source_path),
+                    "-vn",
+                    "-f",
+                    "f32le",
+                    "-ac",
+                    "1",
+                    "-ar",
+                    str(SAMPLE_RATE),
+                    "-y",
+                    raw_path,
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True,
+            )
+        except FileNotFoundError:
+            return None, "ffmpeg를 찾을 수 없습니다. 녹화 서버에 ffmpeg가 설치되어 있는지 확인하세요."
+        except subprocess.CalledProcessError as exc:  # noqa: BLE001 - surfaced to caller for user feedback
+            detail = (exc.stderr or b"").decode("utf-8", errors="replace").strip()
+            return None, f"오디오 추출에 실패했습니다. 파일이 손상되었을 수 있습니다: {detail}"
+
+        if os.path.getsize(raw_path) == 0:
+            return numpy.zeros(0, dtype=numpy.float32), None
+        # Copy-on-write keeps the file untouched even if a caller edits samples;
+        # the mapping outlives the unlink below.
+        return numpy.memmap(raw_path, dtype=numpy.float32, mode="c"), None
+    finally:
+        try:
+            os.unlink(raw_path)
+        except OSError:
+            pass
 
 
 def transcribe_file(
@@ -163,82 +340,132 @@ def transcribe_file(
     source_path = source_path.expanduser()
     output_path = output_path.expanduser()
 
-    if not source_path.exists() or not source_path.is_file():
+    # One stat answers existence, type and size.
+    try:
+        source_stat = source_path.stat()
+    except OSError:
+        source_stat = None
+    if source_stat is None or not stat.S_ISREG(source_stat.st_mode):
         return None, f"전사 대상 파일을 찾을 수 없습니다: {source_path}"
 
-    if source_path.stat().st_size == 0:
+    if source_stat.st_size == 0:
         return None, "전사 대상 파일이 비어 있습니다. 녹화가 정상적으로 완료되었는지 확인하세요."
 
-    cleanup_path: Path | None = None
+    options = options or WhisperOptions()
+    _load_model(options)
+
+    _emit_progress(on_progress, 0.02, "전사 준비 중...")
+    # Decode once and hand the samples to Whisper: the duration falls out of
+    # the array length, so ffprobe is only needed when decoding fails.
+    audio = None
     try:
-        options = options or WhisperOptions()
-        model = _load_model(options)
+        audio = decode_audio(str(source_path), sampling_rate=SAMPLE_RATE)
+    except Exception:  # noqa: BLE001 - fall back to the ffmpeg pipe below
+        logger.warning("Audio decode failed for %s; decoding with ffmpeg", source_path)
+        audio, _ = _load_audio_16k(source_path)
+    total_duration = len(audio) / SAMPLE_RATE if audio is not None else _probe_audio_duration(source_path)
+    if total_duration:
+        _emit_progress(on_progress, 0.05, f"길이 확인: {_format_timestamp(total_duration)}")
 
-        _emit_progress(on_progress, 0.02, "전사 준비 중...")
-        total_duration = _probe_audio_duration(source_path)
-        if total_duration:
-            _emit_progress(on_progress, 0.05, f"길이 확인: {_format_timestamp(total_duration)}")
+    try:
+        segments = _run_whisper(options, audio if audio is not None else str(source_path))
+    except Exception as exc:  # noqa: BLE001 - surfaced to the caller for user feedback
+        logger.exception("Whisper transcribe failed for %s", source_path)
+        _emit_progress(on_progress, 0.0, "오디오를 다시 인코딩하는 중...")
+
+        fallback_audio, fallback_error = _load_audio_16k(source_path)
+        if fallback_audio is None:
+            _emit_progress(on_progress, 0.0, "전사에 필요한 오디오를 준비하지 못했습니다.")
+            return None, fallback_error or f"전사 작업 중 오류가 발생했습니다: {exc}"
 
-        input_path = source_path
         try:
-            segments, _ = model.transcribe(
-                str(input_path), beam_size=options.beam_size, vad_filter=options.vad_filter
+            segments = _run_whisper(options, fallback_audio)
+        except Exception as inner_exc:  # noqa: BLE001 - surfaced to the caller for user feedback
+            logger.exception(
+                "Whisper transcribe failed after audio extraction for %s", source_path
             )
-        except Exception as exc:  # noqa: BLE001 - surfaced to the caller for user feedback
-            logger.exception("Whisper transcribe failed for %s", source_path)
-            _emit_progress(on_progress, 0.0, "오디오를 다시 인코딩하는 중...")
+            _emit_progress(on_progress, 0.0, "오디오 변환 후에도 전사하지 못했습니다.")
+            return None, f"오디오 추출 후에도 전사하지 못했습니다: {inner_exc}"
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = output_path.with_suffix(output_path.suffix + ".part")
+    header = (
+        f"원본 파일: {source_path.name}\n"
+        f"저장 위치: {source_path.parent}\n"
+        f"전사 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"사용 모델: {options.model_size} ({options.device}/{options.compute_type})\n"
+        "\n"
+    )
+
+    # Lines are written as Whisper yields them so long broadcasts never
+    # hold the whole transcript in memory.
+    separator = ""
+    progress_hint = 0.08
+    last_emit_at = 0.0
+    try:
+        with part_path.open("w", encoding="utf-8", buffering=1 << 16) as handle:
+            handle.write(header)
+            for segment in segments:
+                text = segment.text.strip()
+                if not text:
+                    continue
+                start = _format_timestamp(segment.start)
+                end = _format_timestamp(segment.end)
+                handle.write(f"{separator}[{start} - {end}] {text}")
+                separator = "\n"
+
+                progress_hint += 0.01
+                if total_duration and segment.end:
+                    progress_hint = max(progress_hint, min(segment.end / total_duration, 0.97))
+
+                # Report at most twice a second; callbacks may do network I/O.
+                now = time.monotonic()
+                if now - last_emit_at >= PROGRESS_INTERVAL:
+                    # Include the latest line so the UI shows output long before the end.
+                    preview = text if len(text) <= 40 else f"{text[:40]}…"
+                    _emit_progress(on_progress, progress_hint, f"{end} 처리 중: {preview}")
+                    last_emit_at = now
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    if not separator:
+        part_path.unlink(missing_ok=True)
+        return None, "전사 결과가 비어 있습니다. 오디오가 포함된 파일인지 확인하세요."
+
+    _emit_progress(on_progress, max(progress_hint, 0.98), "전사 결과를 저장하는 중...")
+    os.replace(part_path, output_path)
+
+    _emit_progress(on_progress, 1.0, "전사가 완료되었습니다.")
+    return output_path, None
+
+
+def _warm_model() -> None:
+    try:
+        options = WhisperOptions()
+        model = _load_model(options)
+        if options.batch_size > 1:
+            _load_pipeline(options)
+        # One second of silence with VAD off forces a real encoder/decoder pass,
+        # so CUDA kernel selection and allocator growth happen before the first
+        # user file instead of during it.
+        segments, _ = model.transcribe(
+            numpy.zeros(SAMPLE_RATE, dtype=numpy.float32), beam_size=1, vad_filter=False
+        )
+        for _ in segments:
+            pass
+    except Exception:  # noqa: BLE001 - the first real request will report the error
+        logger.exception("Whisper model warm-up failed")
 
-            fallback_path, fallback_error = _extract_audio_with_ffmpeg(source_path)
-            if not fallback_path:
-                _emit_progress(on_progress, 0.0, "전사에 필요한 오디오를 준비하지 못했습니다.")
-                return None, fallback_error or f"전사 작업 중 오류가 발생했습니다: {exc}"
 
-            cleanup_path = fallback_path
-            input_path = fallback_path
+def start_model_warmup() -> threading.Thread:
+    """Download/load the default model in the background.
 
-            try:
-                segments, _ = model.transcribe(
-                    str(input_path), beam_size=options.beam_size, vad_filter=options.vad_filter
-                )
-            except Exception as inner_exc:  # noqa: BLE001 - surfaced to the caller for user feedback
-                logger.exception(
-                    "Whisper transcribe failed after audio extraction for %s", source_path
-                )
-                _emit_progress(on_progress, 0.0, "오디오 변환 후에도 전사하지 못했습니다.")
-                return None, f"오디오 추출 후에도 전사하지 못했습니다: {inner_exc}"
-
-        lines = []
-        progress_hint = 0.08
-        for segment in segments:
-            text = segment.text.strip()
-            if not text:
-                continue
-            start = _format_timestamp(segment.start)
-            end = _format_timestamp(segment.end)
-            lines.append(f"[{start} - {end}] {text}")
-
-            progress_hint = max(progress_hint, progress_hint + 0.01)
-            if total_duration and segment.end:
-                progress_hint = max(progress_hint, min(segment.end / total_duration, 0.97))
-            _emit_progress(on_progress, progress_hint, f"{_format_timestamp(segment.end)} 처리 중")
-
-        if not lines:
-            return None, "전사 결과가 비어 있습니다. 오디오가 포함된 파일인지 확인하세요."
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        _emit_progress(on_progress, max(progress_hint, 0.98), "전사 결과를 저장하는 중...")
-        header = (
-            f"원본 파일: {source_path.name}\n"
-            f"저장 위치: {source_path.parent}\n"
-            f"전사 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            f"사용 모델: {options.model_size} ({options.device}/{options.compute_type})\n"
-            "\n"
-        )
-        output_path.write_text(header + "\n".join(lines), encoding="utf-8")
+    The cache lock makes a transcription that arrives mid-warm-up wait for
+    the same load instead of starting a second one.
+    """
 
-        _emit_progress(on_progress, 1.0, "전사가 완료되었습니다.")
-        return output_path, None
-    finally:
-        if cleanup_path:
-            cleanup_path.unlink(missing_ok=True)
+    thread = threading.Thread(target=_warm_model, name="whisper-warmup", daemon=True)
+    thread.start()
+    return thread
 
@@ -8,17 +8,38 @@ fallback logic.
 """
 from __future__ import annotations
 
+import functools
 import json
+import logging
 import os
+import re
 import shutil
 import subprocess
+import tempfile
 import textwrap
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import BinaryIO, Callable, Iterable, Tuple
 
 import requests
 
+try:  # optional: faster config parsing and serialization
+  import orjson
+except ImportError:  # pragma: no cover - optional dependency
+  orjson = None
+
+try:  # prefer the in-process API; the yt-dlp CLI remains the fallback
+  import yt_dlp
+except ImportError:  # pragma: no cover - depends on the deployment
+  yt_dlp = None
+
+logger = logging.getLogger(__name__)
+
 BASE_DIR = Path(__file__).parent
 DEFAULT_CONFIG_PATH = BASE_DIR / "config" / "defaults.yaml"
 USER_CONFIG_PATH = BASE_DIR / "config" / "user_settings.yaml"
@@ -31,9 +52,11 @@ DEFAULT_GDRIVE_REMOTE = "gdrive"
 # Configuration helpers
 # ---------------------------------------------------------------------------
 def _load_config(path: Path) -> dict:
-  if path.exists():
-      return json.loads(path.read_text(encoding="utf-8"))
-  return {}
+  if not path.exists():
+      return {}
+  if orjson is not None:
+      return orjson.loads(path.read_bytes())
+  return json.loads(path.read_text(encoding="utf-8"))
 
 
 def _ensure_local_paths(settings: dict) -> None:
@@ -52,7 +75,7 @@ def load_settings() -> dict:
   defaults = _load_config(DEFAULT_CONFIG_PATH)
   overrides = _load_config(USER_CONFIG_PATH)
   merged = {**defaults, **overrides}
-  for section in ("paths", "auth"):
+  for section in ("paths", "auth", "rclone"):
       merged[section] = {**defaults.get(section, {}), **overrides.get(section, {})}
   merged.setdefault("ui", defaults.get("ui", {}))
 
@@ -72,8 +95,13 @@ def load_settings() -> dict:
 # ---------------------------------------------------------------------------
 # Google Drive helpers (via rclone)
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=16)
+def _normalize_remote_name(value: str) -> str:
+  return value.strip() or DEFAULT_GDRIVE_REMOTE
+
+
 def _gdrive_remote_name(auth: dict) -> str:
-  return auth.get("gdrive_remote", DEFAULT_GDRIVE_REMOTE).strip() or DEFAULT_GDRIVE_REMOTE
+  return _normalize_remote_name(auth.get("gdrive_remote", DEFAULT_GDRIVE_REMOTE))
 
 
 def acquire_gdrive_access(auth: dict) -> tuple[bool, str | None]:
@@ -95,50 +123,77 @@ def acquire_gdrive_access(auth: dict) -> tuple[bool, str | None]:
   return True, None
 
 
-def _list_gdrive_children(remote: str, path: str | None = None) -> tuple[list[str] | None, str | None]:
-  target = f"{remote}:{path}" if path else f"{remote}:"
-  rc, stdout, stderr = run_cmd([RCLONE_BIN, "lsjson", "--dirs-only", target])
-  if rc != 0:
-      return None, stderr or stdout or "Google Drive 폴더 조회에 실패했습니다."
+GDRIVE_LIST_TTL = 30.0
+_GDRIVE_LIST_CACHE: dict[tuple[str, int], tuple[float, list[str]]] = {}
+_gdrive_list_lock = threading.Lock()
 
-  try:
-      entries = json.loads(stdout)
-  except json.JSONDecodeError:
-      return None, "rclone lsjson 결과를 해석하지 못했습니다."
 
-  return [item.get("Name") for item in entries if item.get("IsDir")], None
+def _invalidate_gdrive_listing(remote: str) -> None:
+  """Drop cached listings for ``remote`` after an upload may have added folders."""
 
+  with _gdrive_list_lock:
+      for key in [key for key in _GDRIVE_LIST_CACHE if key[0] == remote]:
+          del _GDRIVE_LIST_CACHE[key]
 
-def list_gdrive_folders(auth: dict, *, max_depth: int = 3, limit: int = 200) -> tuple[list[str], str | None]:
-  """Return a flat list of folder paths accessible to the rclone remote."""
 
-  ok, error = acquire_gdrive_access(auth)
-  if error or not ok:
-      return [], error or "Google Drive 연결을 확인하세요."
+def list_gdrive_folders(
+  auth: dict, *, max_depth: int = 3, limit: int | None = 200
+) -> tuple[list[str], str | None]:
+  """Return a flat list of folder paths accessible to the rclone remote.
 
-  remote = _gdrive_remote_name(auth)
-  folders: list[str] = []
-  queue: list[tuple[str, int]] = [("", 0)]
-
-  while queue:
-      current_path, depth = queue.pop(0)
-      children, err = _list_gdrive_children(remote, current_path or None)
-      if err:
-          return folders, err
-
-      for name in children or []:
-          child_path = f"{current_path}/{name}" if current_path else name
-          folders.append(child_path)
-          if depth + 1 < max_depth and len(folders) < limit:
-              queue.append((child_path, depth + 1))
-
-      if len(folders) >= limit:
-          break
+  Listings are reused for ``GDRIVE_LIST_TTL`` seconds so repeated folder
+  pickers do not hit Drive again.
+  """
 
-  return sorted(set(folders)), None
+  remote = _gdrive_remote_name(auth)
+  key = (remote, max_depth)
+  now = time.monotonic()
+  with _gdrive_list_lock:
+      hit = _GDRIVE_LIST_CACHE.get(key)
+  if hit and now - hit[0] < GDRIVE_LIST_TTL:
+      return hit[1][:limit], None
+
+  # One recursive listing returns the whole tree instead of an rclone
+  # process and Drive API call per folder.
+  rc, stdout, stderr = run_cmd(
+      [RCLONE_BIN, "lsf", "-R", "--dirs-only", "--max-depth", str(max_depth), f"{remote}:"]
+  )
+  if rc != 0:
+      # Diagnose the remote setup only on failure so the common path spawns
+      # a single rclone process instead of listremotes + lsf.
+      ok, error = acquire_gdrive_access(auth)
+      if not ok:
+          return [], error or "Google Drive 연결을 확인하세요."
+      return [], stderr or stdout or "Google Drive 폴더 조회에 실패했습니다."
+
+  folders = sorted({path for path in (line.rstrip("/") for line in stdout.splitlines()) if path})
+  with _gdrive_list_lock:
+      _GDRIVE_LIST_CACHE[key] = (now, folders)
+  return folders[:limit], None
+
+
+RCLONE_UPLOAD_DEFAULTS = {"transfers": 8, "checkers": 16, "drive_chunk_size": "64M"}
+
+
+def _rclone_upload_flags(tuning: dict | None = None) -> list[str]:
+  """Return throughput flags for ``rclone copy``, overridable via settings."""
+
+  tuning = {**RCLONE_UPLOAD_DEFAULTS, **(tuning or {})}
+  return [
+      "--transfers",
+      str(tuning["transfers"]),
+      "--checkers",
+      str(tuning["checkers"]),
+      "--drive-chunk-size",
+      str(tuning["drive_chunk_size"]),
+      "--use-mmap",
+      "--fast-list",
+  ]
 
 
-def upload_to_gdrive(local_path: Path, remote_path: str, auth: dict) -> tuple[bool, str]:
+def upload_to_gdrive(
+  local_path: Path, remote_path: str, auth: dict, *, tuning: dict | None = None
+) -> tuple[bool, str]:
   ok, error = acquire_gdrive_access(auth)
   if not ok:
       return False, error or "Google Drive 연결을 확인하세요."
@@ -147,43 +202,353 @@ def upload_to_gdrive(local_path: Path, remote_path: str, auth: dict) -> tuple[bo
   target = remote_path.strip("/")
   destination = f"{remote}:{target}" if target else f"{remote}:"
 
+  cmd = [RCLONE_BIN, "copy", str(local_path), destination, *_rclone_upload_flags(tuning)]
   if local_path.is_dir():
-      source = str(local_path)
+      cmd.append("--create-empty-src-dirs")
   else:
-      source = str(local_path)
+      # A single file only needs a lookup of its own name, not a listing of
+      # the whole destination folder.
+      cmd.append("--no-traverse")
 
-  rc, stdout, stderr = run_cmd([RCLONE_BIN, "copy", source, destination, "--create-empty-src-dirs"])
+  rc, _, stderr = run_cmd(cmd, quiet=True)
   if rc != 0:
-      return False, stderr or stdout or "Google Drive 업로드에 실패했습니다."
+      return False, stderr or "Google Drive 업로드에 실패했습니다."
 
+  _invalidate_gdrive_listing(remote)
   return True, f"{local_path.name}을(를) {destination}으로 업로드했습니다."
 
 
+def upload_many_to_gdrive(
+  local_paths: list[Path], remote_path: str, auth: dict, *, tuning: dict | None = None
+) -> tuple[bool, str]:
+  """Upload sibling files with a single ``rclone copy --files-from-raw`` call.
+
+  One rclone process means one Drive token refresh and connection pool for
+  the whole batch, and ``--transfers`` still sends the files in parallel.
+  All paths must share the same parent directory.
+  """
+
+  if not local_paths:
+      return True, "업로드할 파일이 없습니다."
+
+  parent = local_paths[0].parent
+  if any(path.parent != parent for path in local_paths):
+      raise ValueError("upload_many_to_gdrive expects files from one directory")
+
+  ok, error = acquire_gdrive_access(auth)
+  if not ok:
+      return False, error or "Google Drive 연결을 확인하세요."
+
+  remote = _gdrive_remote_name(auth)
+  target = remote_path.strip("/")
+  destination = f"{remote}:{target}" if target else f"{remote}:"
+
+  with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".lst") as listing:
+      listing.write("".join(f"{path.name}\n" for path in local_paths))
+      listing.flush()
+      rc, _, stderr = run_cmd(
+          [
+              RCLONE_BIN,
+              "copy",
+              str(parent),
+              destination,
+              "--files-from-raw",
+              listing.name,
+              "--no-traverse",
+              *_rclone_upload_flags(tuning),
+          ],
+          quiet=True,
+      )
+  if rc != 0:
+      return False, stderr or "Google Drive 업로드에 실패했습니다."
+
+  _invalidate_gdrive_listing(remote)
+  return True, f"{len(local_paths)}개 파일을 {destination}으로 업로드했습니다."
+
+
+UPLOAD_MAX_ATTEMPTS = 3
+_UPLOAD_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gdrive-upload")
+# Finished jobs are kept for an hour so callers can still poll the result.
+# Insertion order is submission order, so expiry only ever pops the head.
+UPLOAD_JOB_TTL = 3600.0
+_UPLOAD_JOBS: OrderedDict[str, tuple[float, Future]] = OrderedDict()
+_UPLOAD_JOBS_LOCK = threading.Lock()
+
+
+def _expire_upload_jobs(now: float) -> None:
+  expired = []
+  for job_id, (submitted_at, future) in _UPLOAD_JOBS.items():
+      # Jobs are in submission order, so everything after this one is newer.
+      if now - submitted_at < UPLOAD_JOB_TTL:
+          break
+      # A slow upload stays listed without holding back finished ones after it.
+      if future.done():
+          expired.append(job_id)
+  for job_id in expired:
+      del _UPLOAD_JOBS[job_id]
+
+
+def _upload_with_retry(
+  local_path: Path, remote_path: str, auth: dict, tuning: dict | None
+) -> tuple[bool, str]:
+  ok, message = False, "Google Drive 업로드에 실패했습니다."
+  for attempt in range(UPLOAD_MAX_ATTEMPTS):
+      ok, message = upload_to_gdrive(local_path, remote_path, auth, tuning=tuning)
+      if ok:
+          break
+      if attempt + 1 < UPLOAD_MAX_ATTEMPTS:
+          time.sleep(2**attempt)
+  return ok, message
+
+
+def upload_to_gdrive_async(
+  local_path: Path, remote_path: str, auth: dict, *, tuning: dict | None = None
+) -> str:
+  """Queue an upload on the background pool and return its job id.
+
+  Failed uploads are retried with exponential backoff (1s, 2s) up to
+  ``UPLOAD_MAX_ATTEMPTS`` times; poll :func:`upload_status` for the result.
+  """
+
+  job_id = uuid.uuid4().hex
+  future = _UPLOAD_POOL.submit(_upload_with_retry, local_path, remote_path, auth, tuning)
+  now = time.monotonic()
+  with _UPLOAD_JOBS_LOCK:
+      _expire_upload_jobs(now)
+      _UPLOAD_JOBS[job_id] = (now, future)
+  return job_id
+
+
+def upload_status(job_id: str) -> tuple[str, str | None]:
+  """Return (state, message) where state is unknown/queued/running/done/failed."""
+
+  with _UPLOAD_JOBS_LOCK:
+      job = _UPLOAD_JOBS.get(job_id)
+  if job is None:
+      return "unknown", None
+  future = job[1]
+  if not future.done():
+      return ("running" if future.running() else "queued"), None
+
+  error = future.exception()
+  if error is not None:
+      return "failed", str(error)
+  ok, message = future.result()
+  return ("done" if ok else "failed"), message
+
+
+def _drain_stderr(process: subprocess.Popen) -> Callable[[], str]:
+  """Read ``process.stderr`` on a helper thread into a bounded tail.
+
+  A pipe only buffers ~64 KiB, so a chatty child blocks on stderr unless it
+  is drained while the caller is busy with stdin/stdout. The returned
+  callable joins the reader and gives back the decoded tail.
+  """
+
+  tail: deque[bytes] = deque(maxlen=STDERR_TAIL_LINES)
+
+  def _reader() -> None:
+      with process.stderr:
+          for line in process.stderr:
+              tail.append(line)
+
+  thread = threading.Thread(target=_reader, name="stderr-drain", daemon=True)
+  thread.start()
+
+  def _result() -> str:
+      thread.join()
+      return b"".join(tail).decode("utf-8", errors="replace").strip()
+
+  return _result
+
+
+def upload_stream_to_gdrive(
+  stream: BinaryIO, file_name: str, remote_path: str, auth: dict, *, size: int | None = None
+) -> tuple[bool, str]:
+  """Upload a file-like object to Google Drive via ``rclone rcat``.
+
+  The bytes are piped straight into rclone so callers do not need to stage
+  the upload on local disk first.
+  """
+
+  ok, error = acquire_gdrive_access(auth)
+  if not ok:
+      return False, error or "Google Drive 연결을 확인하세요."
+
+  remote = _gdrive_remote_name(auth)
+  target = "/".join(part for part in (remote_path.strip("/"), file_name) if part)
+  destination = f"{remote}:{target}"
+
+  cmd = [RCLONE_BIN, "rcat", destination]
+  if size:
+      cmd.extend(["--size", str(size)])
+
+  try:
+      process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+  except FileNotFoundError as exc:
+      return False, f"{Path(RCLONE_BIN).name} executable not found: {exc}"
+
+  stderr = _drain_stderr(process)
+  try:
+      shutil.copyfileobj(stream, process.stdin, 1024 * 1024)
+  except BrokenPipeError:
+      pass  # rclone exited early; its stderr explains why
+  try:
+      process.stdin.close()
+  except BrokenPipeError:
+      pass
+
+  process.wait()
+  message = stderr()
+  if process.returncode != 0:
+      return False, message or "Google Drive 업로드에 실패했습니다."
+
+  _invalidate_gdrive_listing(remote)
+  return True, f"{file_name}을(를) {remote}:{remote_path.strip('/')}으로 업로드했습니다."
+
+
+def yt_pipe_to_gdrive(url: str, file_stem: str, remote_path: str, auth: dict) -> tuple[bool, str, str]:
+  """Stream ``yt-dlp -o -`` straight into ``rclone rcat`` without local staging.
+
+  The same format selector as :func:`yt_download` is used. With ffmpeg,
+  yt-dlp merges the streams on the fly and writes MPEG-TS to stdout, so the
+  upload is named ``.ts``. Returns (ok, message, uploaded_file_name).
+  """
+
+  ffmpeg = _ffmpeg_path()
+  file_name = f"{file_stem}{'.ts' if ffmpeg else '.mp4'}"
+
+  ok, error = acquire_gdrive_access(auth)
+  if not ok:
+      return False, error or "Google Drive 연결을 확인하세요.", file_name
+
+  remote = _gdrive_remote_name(auth)
+  target = "/".join(part for part in (remote_path.strip("/"), file_name) if part)
+  destination = f"{remote}:{target}"
+
+  cmd = [
+      "yt-dlp",
+      "-q",
+      "-o",
+      "-",
+      "-f",
+      _yt_format_selector(allow_ffmpeg=ffmpeg is not None),
+      "--extractor-args",
+      YOUTUBE_EXTRACTOR_ARGS,
+  ]
+  if ffmpeg:
+      cmd.extend(["--ffmpeg-location", str(ffmpeg)])
+  try:
+      downloader = subprocess.Popen([*cmd, url], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+  except FileNotFoundError as exc:
+      return False, f"yt-dlp executable not found: {exc}", file_name
+
+  try:
+      uploader = subprocess.Popen(
+          [RCLONE_BIN, "rcat", destination], stdin=downloader.stdout, stderr=subprocess.PIPE
+      )
+  except FileNotFoundError as exc:
+      downloader.kill()
+      downloader.wait()
+      downloader.stderr.close()
+      return False, f"{Path(RCLONE_BIN).name} executable not found: {exc}", file_name
+  finally:
+      # Only rclone should hold the read end, so yt-dlp sees EPIPE if it exits.
+      downloader.stdout.close()
+
+  # Both stderr pipes are drained concurrently so neither child can block on
+  # a full pipe while we wait on the other.
+  download_err = _drain_stderr(downloader)
+  upload_err = _drain_stderr(uploader)
+  uploader.wait()
+  downloader.wait()
+  upload_message = upload_err()
+  download_message = download_err()
+  # A failed rclone also breaks yt-dlp's pipe, so check the uploader first to
+  # report the process that actually failed.
+  if uploader.returncode != 0:
+      return False, upload_message or "Google Drive 업로드에 실패했습니다.", file_name
+  if downloader.returncode != 0:
+      return False, download_message or "다운로드 중 알 수 없는 오류가 발생했습니다.", file_name
+
+  _invalidate_gdrive_listing(remote)
+  return True, f"{file_name}을(를) {remote}:{remote_path.strip('/')}으로 업로드했습니다.", file_name
+
+
 def save_settings(data: dict) -> None:
+  """Write user settings atomically.
+
+  The file is written next to the target and swapped in with os.replace, so
+  a concurrent :func:`load_settings` sees either the old or the new file,
+  never a half-written one.
+  """
+
   USER_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-  USER_CONFIG_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+  if orjson is not None:
+      payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+  else:
+      payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+  fd, temp_path = tempfile.mkstemp(dir=USER_CONFIG_PATH.parent, prefix=f".{USER_CONFIG_PATH.name}.")
+  try:
+      with os.fdopen(fd, "wb") as handle:
+          handle.write(payload)
+      if USER_CONFIG_PATH.exists():
+          shutil.copymode(USER_CONFIG_PATH, temp_path)
+      os.replace(temp_path, USER_CONFIG_PATH)
+  except BaseException:
+      try:
+          os.unlink(temp_path)
+      except OSError:
+          pass
+      raise
 
 
 # ---------------------------------------------------------------------------
 # Command helpers
 # ---------------------------------------------------------------------------
-def run_cmd(cmd: Iterable[str], **kwargs) -> Tuple[int, str, str]:
+STDERR_TAIL_LINES = 512
+
+
+def run_cmd(cmd: Iterable[str], *, quiet: bool = False, **kwargs) -> Tuple[int, str, str]:
   """Run a command and return (returncode, stdout, stderr).
 
   A missing binary is reported as a standard return code (127) so callers can
-  surface a helpful error message instead of crashing.
+  surface a helpful error message instead of crashing. quiet=True discards
+  stdout and keeps only the last ``STDERR_TAIL_LINES`` lines of stderr, for
+  long-running uploads and transcodes whose output only matters when they
+  fail.
   """
 
+  cmd = list(cmd)
   try:
-      process = subprocess.run(list(cmd), capture_output=True, text=True, **kwargs)
+      if quiet:
+          returncode, stderr = _run_quiet(cmd, **kwargs)
+          return returncode, "", stderr.decode("utf-8", errors="replace")
+      process = subprocess.run(cmd, capture_output=True, text=True, **kwargs)
       return process.returncode, process.stdout or "", process.stderr or ""
   except FileNotFoundError as exc:  # pragma: no cover - exercised via higher level
-      missing = Path(list(cmd)[0]).name
+      missing = Path(cmd[0]).name
       return 127, "", f"{missing} executable not found: {exc}"
 
 
+def _run_quiet(cmd: list[str], **kwargs) -> tuple[int, bytes]:
+  # stdout goes to DEVNULL, so draining stderr alone cannot deadlock.
+  tail: deque[bytes] = deque(maxlen=STDERR_TAIL_LINES)
+  with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, **kwargs) as process:
+      for line in process.stderr:
+          tail.append(line)
+      returncode = process.wait()
+  return returncode, b"".join(tail).strip()
+
+
+@functools.lru_cache(maxsize=1)
 def _ffmpeg_path() -> Path | None:
-  """Return an ffmpeg path when it is available or configured via env."""
+  """Return an ffmpeg path when it is available or configured via env.
+
+  The PATH walk runs once per process; call ``_ffmpeg_path.cache_clear()``
+  after changing PATH or FFMPEG_PATH.
+  """
 
   env_path = Path(shutil.which("ffmpeg") or "")
   if env_path.exists():
@@ -207,9 +572,87 @@ def ffmpeg_path() -> Path | None:
   return _ffmpeg_path()
 
 
+# ---------------------------------------------------------------------------
+# yt-dlp Python API helpers
+# ---------------------------------------------------------------------------
+YTDLP_API_EXTRACTOR_ARGS = {"youtube": {"player_client": ["android"]}}
+_ydl_local = threading.local()
+
+
+def _ydl_info_client():
+  """Return this thread's metadata-only YoutubeDL instance.
+
+  Building a YoutubeDL loads the extractor registry, so it is done once per
+  thread instead of paying a yt-dlp process start for every lookup.
+  """
+
+  client = getattr(_ydl_local, "info_client", None)
+  if client is None:
+      client = yt_dlp.YoutubeDL(
+          {
+              "quiet": True,
+              "no_warnings": True,
+              "noplaylist": True,
+              "format": "best",
+              "extractor_args": YTDLP_API_EXTRACTOR_ARGS,
+          }
+      )
+      _ydl_local.info_client = client
+  return client
+
+
+# Metadata lookups are cached briefly per video so a live start followed by
+# captures, or a retried request, does not repeat a 2-5 s extraction. The
+# TTL keeps live/ended state and stream URLs fresh.
+YT_INFO_TTL = 60.0
+YT_INFO_CACHE_SIZE = 128
+_VIDEO_ID_RE = re.compile(r"(?:[?&]v=|/live/|/shorts/|/embed/|youtu\.be/)([A-Za-z0-9_-]{11})")
+_yt_info_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_yt_info_lock = threading.Lock()
+
+
+def _video_cache_key(url: str) -> str:
+  """Map watch?v=, youtu.be/, /live/ and similar URLs of one video to its id."""
+
+  match = _VIDEO_ID_RE.search(url)
+  return match.group(1) if match else url.strip()
+
+
+def _yt_extract_info(url: str) -> tuple[dict | None, str | None]:
+  key = _video_cache_key(url)
+  now = time.monotonic()
+  with _yt_info_lock:
+      cached = _yt_info_cache.get(key)
+      if cached is not None and now - cached[0] < YT_INFO_TTL:
+          _yt_info_cache.move_to_end(key)
+          return cached[1], None
+
+  try:
+      info = _ydl_info_client().extract_info(url, download=False)
+  except Exception as exc:  # noqa: BLE001 - extractor bugs surface as arbitrary errors
+      logger.warning("yt-dlp metadata lookup failed for %s", url, exc_info=True)
+      return None, str(exc)
+  if not isinstance(info, dict):
+      return None, None
+
+  with _yt_info_lock:
+      _yt_info_cache[key] = (now, info)
+      _yt_info_cache.move_to_end(key)
+      while len(_yt_info_cache) > YT_INFO_CACHE_SIZE:
+          _yt_info_cache.popitem(last=False)
+  return info, None
+
+
 def resolve_live_stream_url(url: str) -> tuple[str | None, str | None]:
   """Return the direct streaming URL for a YouTube live address."""
 
+  if yt_dlp is not None:
+      info, _ = _yt_extract_info(url)
+      stream_url = (info or {}).get("url")
+      if not stream_url:
+          return None, "스트리밍 URL을 확인하지 못했습니다. 링크가 올바른지 확인하세요."
+      return stream_url, None
+
   rc, stdout, _ = run_cmd(["yt-dlp", "-g", "-f", "best", "--extractor-args", YOUTUBE_EXTRACTOR_ARGS, url])
   if rc != 0 or not stdout.strip():
       return None, "스트리밍 URL을 확인하지 못했습니다. 링크가 올바른지 확인하세요."
@@ -218,9 +661,42 @@ def resolve_live_stream_url(url: str) -> tuple[str | None, str | None]:
   return stream_url, None
 
 
+def resolve_live_stream(url: str) -> tuple[str | None, str | None, str | None]:
+  """Return (stream_url, title, error) from a single metadata lookup.
+
+  Starting a recording needs both values; fetching them together avoids a
+  second extraction (or yt-dlp process) for the same URL.
+  """
+
+  if yt_dlp is not None:
+      info, _ = _yt_extract_info(url)
+      info = info or {}
+      stream_url = info.get("url")
+      if not stream_url:
+          return None, None, "스트리밍 URL을 확인하지 못했습니다. 링크가 올바른지 확인하세요."
+      title = (info.get("title") or "").strip()
+      return stream_url, (textwrap.shorten(title, width=120, placeholder="…") if title else None), None
+
+  # -e prints the title before the -g stream URL.
+  rc, stdout, _ = run_cmd(
+      ["yt-dlp", "-e", "-g", "-f", "best", "--no-warnings", "--extractor-args", YOUTUBE_EXTRACTOR_ARGS, url]
+  )
+  lines = [line.strip() for line in stdout.splitlines() if line.strip()]
+  if rc != 0 or len(lines) < 2:
+      return None, None, "스트리밍 URL을 확인하지 못했습니다. 링크가 올바른지 확인하세요."
+  return lines[1], textwrap.shorten(lines[0], width=120, placeholder="…"), None
+
+
 def fetch_video_title(url: str) -> tuple[str | None, str | None]:
   """Return the title of a YouTube video or live stream."""
 
+  if yt_dlp is not None:
+      info, error = _yt_extract_info(url)
+      title = ((info or {}).get("title") or "").strip()
+      if not title:
+          return None, error or "영상 제목을 가져오지 못했습니다."
+      return textwrap.shorten(title, width=120, placeholder="…"), None
+
   rc, stdout, stderr = run_cmd(["yt-dlp", "--get-title", "--no-warnings", "--extractor-args", YOUTUBE_EXTRACTOR_ARGS, url])
   if rc != 0 or not stdout.strip():
       return None, stderr or "영상 제목을 가져오지 못했습니다."
@@ -229,6 +705,13 @@ def fetch_video_title(url: str) -> tuple[str | None, str | None]:
   return textwrap.shorten(title, width=120, placeholder="…"), None
 
 
+def _capture_output_path(dest_dir: Path, extension: str) -> Path:
+  # Microsecond precision makes collisions practically impossible, so no
+  # exists() probing is needed; no colons keeps the names valid on SMB/Windows.
+  timestamp = datetime.now().strftime("%y%m%d_%H%M%S_%f")
+  return dest_dir / f"{timestamp}{extension}"
+
+
 def capture_live_frame(url: str, dest_dir: Path | None = None) -> tuple[Path | None, str | None]:
   """Capture a single frame from a YouTube live stream.
 
@@ -242,42 +725,88 @@ def capture_live_frame(url: str, dest_dir: Path | None = None) -> tuple[Path | N
   dest_dir = Path(dest_dir or BASE_DIR / "static" / "captures")
   dest_dir.mkdir(parents=True, exist_ok=True)
 
-  stream_url, error = resolve_live_stream_url(url)
-  if error or not stream_url:
-      return None, error
-  timestamp = datetime.now().strftime("%y%m%d_%H:%M:%S")
-  output_path = dest_dir / f"{timestamp}.png"
-  suffix = 1
-  while output_path.exists():
-      output_path = dest_dir / f"{timestamp}_{suffix}.png"
-      suffix += 1
-
-  rc, _, _ = run_cmd(
-      [
-          "ffmpeg",
-          "-y",
-          "-loglevel",
-          "error",
-          "-ss",
-          "00:00:01",
-          "-i",
-          stream_url,
-          "-frames:v",
-          "1",
-          str(output_path),
-      ]
-  )
+  # JPEG encodes far faster than PNG's zlib pass and is ~5x smaller; ffmpeg
+  # falls back to software decode when no hardware decoder is available.
+  output_path = _capture_output_path(dest_dir, ".jpg")
+  frame_args = ["-frames:v", "1", "-q:v", "3", str(output_path)]
 
-  if rc != 0 or not output_path.exists():
+  if yt_dlp is None:
+      # Without the in-process API, stream yt-dlp straight into ffmpeg rather
+      # than running `yt-dlp -g` first and opening the URL a second time.
+      ok = _capture_frame_from_pipe(url, frame_args)
+  else:
+      stream_url, error = resolve_live_stream_url(url)
+      if error or not stream_url:
+          return None, error
+      rc, _, _ = run_cmd(
+          [
+              "ffmpeg",
+              "-y",
+              "-hwaccel",
+              "auto",
+              "-loglevel",
+              "error",
+              "-ss",
+              "00:00:01",
+              "-i",
+              stream_url,
+              *frame_args,
+          ],
+          quiet=True,
+      )
+      ok = rc == 0
+
+  if not ok or not output_path.exists():
       return None, "캡처 중 오류가 발생했습니다. 스트림 접근 권한 또는 네트워크 상태를 확인하세요."
 
   return output_path, None
 
 
+def _capture_frame_from_pipe(url: str, frame_args: list[str]) -> bool:
+  """Run ``yt-dlp -o - | ffmpeg -i pipe:0`` and return whether ffmpeg succeeded."""
+
+  try:
+      downloader = subprocess.Popen(
+          ["yt-dlp", "-q", "-o", "-", "-f", "best", "--extractor-args", YOUTUBE_EXTRACTOR_ARGS, url],
+          stdout=subprocess.PIPE,
+          stderr=subprocess.DEVNULL,
+      )
+  except FileNotFoundError:
+      return False
+
+  try:
+      rc, _, _ = run_cmd(
+          ["ffmpeg", "-y", "-loglevel", "error", "-i", "pipe:0", "-ss", "00:00:01", *frame_args],
+          stdin=downloader.stdout,
+          quiet=True,
+      )
+  finally:
+      # Live streams never end on their own; stop yt-dlp once ffmpeg is done.
+      downloader.stdout.close()
+      downloader.kill()
+      downloader.wait()
+  return rc == 0
+
+
 # ---------------------------------------------------------------------------
 # YouTube download helpers
 # ---------------------------------------------------------------------------
 DEFAULT_OUTPUT_TEMPLATE = "%(title).80B.mp4"
+# Parallel HLS/DASH fragments plus ranged HTTP chunks; YouTube throttles
+# single long-lived range requests, so chunking keeps throughput steady.
+YTDLP_CONCURRENT_FRAGMENTS = 8
+YTDLP_HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+YTDLP_RETRIES = 5
+YTDLP_FRAGMENT_RETRIES = 10
+
+
+def _yt_format_selector(*, allow_ffmpeg: bool = True) -> str:
+  if not allow_ffmpeg:
+      # Avoid formats that require muxing when ffmpeg is missing. Restrict to
+      # progressive streams with both audio/video so yt-dlp can save without
+      # additional tools.
+      return "best[ext=mp4][acodec!=none][vcodec!=none]/best[acodec!=none]"
+  return "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"
 
 
 def _yt_common_opts(
@@ -291,12 +820,7 @@ def _yt_common_opts(
   download_dir = Path(download_dir or BASE_DIR / "recordings")
   download_dir.mkdir(parents=True, exist_ok=True)
 
-  format_selector = "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"
-  if not allow_ffmpeg:
-      # Avoid formats that require muxing when ffmpeg is missing. Restrict to
-      # progressive streams with both audio/video so yt-dlp can save without
-      # additional tools.
-      format_selector = "best[ext=mp4][acodec!=none][vcodec!=none]/best[acodec!=none]"
+  format_selector = _yt_format_selector(allow_ffmpeg=allow_ffmpeg)
 
   opts: list[str] = [
       "-o",
@@ -307,6 +831,14 @@ def _yt_common_opts(
       YOUTUBE_EXTRACTOR_ARGS,
       "-f",
       format_selector,
+      "--concurrent-fragments",
+      str(YTDLP_CONCURRENT_FRAGMENTS),
+      "--http-chunk-size",
+      str(YTDLP_HTTP_CHUNK_SIZE),
+      "--retries",
+      str(YTDLP_RETRIES),
+      "--fragment-retries",
+      str(YTDLP_FRAGMENT_RETRIES),
   ]
   if allow_ffmpeg:
       if ffmpeg_path:
@@ -315,19 +847,81 @@ def _yt_common_opts(
           "--remux-video",
           "mp4",
           "--postprocessor-args",
-          "-c:v copy -c:a copy",
+          "-c:v copy -c:a copy -movflags +faststart",
       ])
   return opts
 
 
-def _expected_download_path(download_dir: Path) -> Path | None:
-  """Return the most recent file in the directory if any exists."""
-  files = sorted(
-      download_dir.glob("*"),
-      key=lambda p: p.stat().st_mtime if p.exists() else 0,
-      reverse=True,
-  )
-  return files[0] if files else None
+def _yt_api_opts(
+  *, allow_ffmpeg: bool = True, download_dir: Path | None = None, ffmpeg_path: Path | None = None
+) -> dict:
+  """YoutubeDL options mirroring :func:`_yt_common_opts` for the Python API."""
+
+  cli_opts = _yt_common_opts(allow_ffmpeg=allow_ffmpeg, download_dir=download_dir, ffmpeg_path=ffmpeg_path)
+  opts: dict = {
+      "outtmpl": {"default": cli_opts[cli_opts.index("-o") + 1]},
+      "format": cli_opts[cli_opts.index("-f") + 1],
+      "noplaylist": True,
+      "noprogress": True,
+      "quiet": True,
+      "no_warnings": True,
+      "extractor_args": YTDLP_API_EXTRACTOR_ARGS,
+      "concurrent_fragment_downloads": YTDLP_CONCURRENT_FRAGMENTS,
+      "http_chunk_size": YTDLP_HTTP_CHUNK_SIZE,
+      "retries": YTDLP_RETRIES,
+      "fragment_retries": YTDLP_FRAGMENT_RETRIES,
+  }
+  if allow_ffmpeg:
+      if ffmpeg_path:
+          opts["ffmpeg_location"] = str(ffmpeg_path)
+      opts["postprocessors"] = [{"key": "FFmpegVideoRemuxer", "preferedformat": "mp4"}]
+      opts["postprocessor_args"] = {"default": ["-c:v", "copy", "-c:a", "copy", "-movflags", "+faststart"]}
+  return opts
+
+
+def _ydl_download_client(opts: dict):
+  """Return this thread's downloading YoutubeDL for ``opts``.
+
+  Like :func:`_ydl_info_client`, the instance is kept per thread and per
+  option set, so repeated downloads into the same folder reuse its open
+  HTTP connections to YouTube.
+  """
+
+  clients = getattr(_ydl_local, "download_clients", None)
+  if clients is None:
+      clients = _ydl_local.download_clients = {}
+  key = (yt_dlp.YoutubeDL, repr(sorted(opts.items())))
+  client = clients.get(key)
+  if client is None:
+      client = clients[key] = yt_dlp.YoutubeDL(opts)
+  return client
+
+
+def _yt_download_once(
+  url: str, download_dir: Path, *, use_ffmpeg: bool, ffmpeg_path: Path | None
+) -> tuple[Path | None, str | None]:
+  """Run one download attempt and return (downloaded_path, error_message).
+
+  The path comes from yt-dlp itself, so concurrent downloads into the same
+  directory never pick up each other's files.
+  """
+
+  if yt_dlp is not None:
+      opts = _yt_api_opts(allow_ffmpeg=use_ffmpeg, download_dir=download_dir, ffmpeg_path=ffmpeg_path)
+      try:
+          info = _ydl_download_client(opts).extract_info(url, download=True)
+      except yt_dlp.utils.DownloadError as exc:
+          return None, str(exc)
+      downloads = (info or {}).get("requested_downloads") or [{}]
+      filepath = downloads[0].get("filepath")
+      return (Path(filepath) if filepath else None), None
+
+  opts = _yt_common_opts(allow_ffmpeg=use_ffmpeg, download_dir=download_dir, ffmpeg_path=ffmpeg_path)
+  rc, stdout, stderr = run_cmd(["yt-dlp", url, *opts, "--print", "after_move:filepath"])
+  if rc != 0:
+      return None, stderr or stdout
+  lines = [line for line in stdout.splitlines() if line.strip()]
+  return (Path(lines[-1].strip()) if lines else None), None
 
 
 def yt_download(url: str, download_dir: Path, *, allow_ffmpeg: bool = True) -> tuple[Path | None, str | None]:
@@ -345,15 +939,10 @@ def yt_download(url: str, download_dir: Path, *, allow_ffmpeg: bool = True) -> t
   attempts.append(False)  # always keep a non-ffmpeg fallback
 
   for use_ffmpeg in attempts:
-      opts = _yt_common_opts(
-          allow_ffmpeg=use_ffmpeg, download_dir=download_dir, ffmpeg_path=ffmpeg_path
-      )
-      rc, stdout, stderr = run_cmd(["yt-dlp", url, *opts])
-      if rc == 0:
-          path = _expected_download_path(download_dir)
-          if path and path.exists():
-              return path, None
-      last_error = stderr or stdout or "다운로드 중 알 수 없는 오류가 발생했습니다."
+      path, error = _yt_download_once(url, download_dir, use_ffmpeg=use_ffmpeg, ffmpeg_path=ffmpeg_path)
+      if path and path.exists():
+          return path, None
+      last_error = error or "다운로드 중 알 수 없는 오류가 발생했습니다."
 
   return None, last_error
 